@@ -1,23 +1,58 @@
 """Command-line interface for Kitty Voice Controller."""
 
 import argparse
+import importlib.util
+import os
 import sys
 from pathlib import Path
+from typing import Callable
 
 from rich.console import Console
-from rich.table import Table
 
 from .config import CONFIG_FILE, Config, init_config, ensure_config_exists
-from .controller import VoiceController
-from .kitty import check_kitty_setup
-from .voice_output import VoiceOutputHandler
+
+# Command modules (controller, kitty, voice I/O, rich.table) are imported inside
+# the handlers that use them so that `--help`, `list`, etc. don't pay for
+# Whisper/torch imports.
 
 
 console = Console()
 
 
+def _render_table(
+    title: str,
+    columns: list[tuple[str, str | None]],
+    rows: list[tuple[str, ...]],
+) -> None:
+    """Print a table: styled with Rich on a terminal, plain aligned text otherwise.
+
+    Args:
+        title: Table title (Rich only)
+        columns: (header, Rich style) per column
+        rows: Cell values per row
+    """
+    if console.is_terminal and not os.environ.get("NO_COLOR"):
+        from rich.table import Table
+
+        table = Table(title=title)
+        for header, style in columns:
+            table.add_column(header, style=style)
+        for row in rows:
+            table.add_row(*row)
+        console.print(table)
+        return
+
+    headers = tuple(header for header, _ in columns)
+    widths = [max(len(cell) for cell in col) for col in zip(headers, *rows)]
+    for row in (headers, *rows):
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
+
+
 def cmd_start(args) -> int:
     """Start the voice controller."""
+    from .controller import VoiceController
+    from .kitty import check_kitty_setup
+
     config = ensure_config_exists()
 
     if not config.projects:
@@ -65,7 +100,8 @@ def cmd_add(args) -> int:
     """Add a project."""
     config = ensure_config_exists()
 
-    directory = Path(args.directory).expanduser().resolve()
+    # Absolute is enough here; no need to resolve symlinks on disk
+    directory = Path(os.path.abspath(os.path.expanduser(args.directory)))
     if not directory.exists():
         console.print(f"[red]Directory not found:[/red] {directory}")
         return 1
@@ -108,40 +144,37 @@ def cmd_list(args) -> int:
         console.print(f"Run 'claude-voice add <name> <directory>' to add one")
         return 0
 
-    table = Table(title="Configured Projects")
-    table.add_column("Name", style="cyan")
-    table.add_column("Directory", style="green")
-    table.add_column("Command")
-    table.add_column("Aliases", style="dim")
-
-    for name, project in config.projects.items():
-        table.add_row(
-            name,
-            str(project.directory),
-            project.command,
-            ", ".join(project.voice_alias) if project.voice_alias else "-",
-        )
-
-    console.print(table)
+    _render_table(
+        "Configured Projects",
+        [("Name", "cyan"), ("Directory", "green"), ("Command", None), ("Aliases", "dim")],
+        [
+            (
+                name,
+                str(project.directory),
+                project.command,
+                ", ".join(project.voice_alias) if project.voice_alias else "-",
+            )
+            for name, project in config.projects.items()
+        ],
+    )
     return 0
 
 
 def cmd_voices(args) -> int:
     """List available macOS voices."""
+    from .voice_output import VoiceOutputHandler
+
     voices = VoiceOutputHandler.list_voices()
 
     if not voices:
         console.print("[yellow]Could not list voices[/yellow]")
         return 1
 
-    table = Table(title="Available Voices")
-    table.add_column("Name", style="cyan")
-    table.add_column("Language")
-
-    for voice in voices:
-        table.add_row(voice["name"], voice.get("language", ""))
-
-    console.print(table)
+    _render_table(
+        "Available Voices",
+        [("Name", "cyan"), ("Language", None)],
+        [(voice["name"], voice.get("language", "")) for voice in voices],
+    )
     console.print("\nSet your preferred voice in config:")
     console.print(f"  {CONFIG_FILE}")
     return 0
@@ -149,6 +182,8 @@ def cmd_voices(args) -> int:
 
 def cmd_check(args) -> int:
     """Check system setup."""
+    from .kitty import check_kitty_setup
+
     console.print("[bold]Checking system setup...[/bold]\n")
 
     # Check Kitty
@@ -159,12 +194,15 @@ def cmd_check(args) -> int:
         console.print(f"[red]✗[/red] Kitty terminal: {message}")
 
     # Check config
+    whisper_backend = "whisper"
     if CONFIG_FILE.exists():
         config = Config.load()
         console.print(f"[green]✓[/green] Config file: {CONFIG_FILE}")
         console.print(f"  Projects: {len(config.projects)}")
         console.print(f"  Hotkey: {config.voice.hotkey}")
         console.print(f"  Whisper model: {config.voice.whisper_model}")
+        console.print(f"  Whisper backend: {config.voice.whisper_backend}")
+        whisper_backend = config.voice.whisper_backend
     else:
         console.print(f"[yellow]![/yellow] No config file (run 'claude-voice init')")
 
@@ -179,17 +217,27 @@ def cmd_check(args) -> int:
     ]
 
     for module, package in deps:
-        try:
-            __import__(module)
+        # find_spec checks availability without executing the module (whisper pulls in torch)
+        if importlib.util.find_spec(module) is not None:
             console.print(f"  [green]✓[/green] {package}")
-        except ImportError:
+        else:
             console.print(f"  [red]✗[/red] {package} (pip install {package})")
 
+    # Optional extra, only required when selected as the backend
+    if importlib.util.find_spec("faster_whisper") is not None:
+        console.print("  [green]✓[/green] faster-whisper")
+    elif whisper_backend == "faster-whisper":
+        console.print("  [red]✗[/red] faster-whisper (pip install faster-whisper)")
+    else:
+        console.print("  [yellow]-[/yellow] faster-whisper (optional: pip install faster-whisper)")
+
     return 0
 
 
 def cmd_test_voice(args) -> int:
     """Test voice output."""
+    from .voice_output import VoiceOutputHandler
+
     config = ensure_config_exists()
     voice = VoiceOutputHandler(config.voice)
 
@@ -199,15 +247,7 @@ def cmd_test_voice(args) -> int:
     return 0
 
 
-def main() -> int:
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        prog="claude-voice",
-        description="Voice-controlled interface for Claude Code in Kitty terminal",
-    )
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # start
+def _add_start_parser(subparsers) -> None:
     start_parser = subparsers.add_parser("start", help="Start voice control")
     start_parser.add_argument(
         "projects",
@@ -216,12 +256,14 @@ def main() -> int:
     )
     start_parser.set_defaults(func=cmd_start)
 
-    # init
+
+def _add_init_parser(subparsers) -> None:
     init_parser = subparsers.add_parser("init", help="Initialize configuration")
     init_parser.add_argument("--force", action="store_true", help="Overwrite existing config")
     init_parser.set_defaults(func=cmd_init)
 
-    # add
+
+def _add_add_parser(subparsers) -> None:
     add_parser = subparsers.add_parser("add", help="Add a project")
     add_parser.add_argument("name", help="Project name")
     add_parser.add_argument("directory", help="Project directory")
@@ -229,28 +271,64 @@ def main() -> int:
     add_parser.add_argument("--alias", "-a", action="append", help="Voice alias (can specify multiple)")
     add_parser.set_defaults(func=cmd_add)
 
-    # remove
+
+def _add_remove_parser(subparsers) -> None:
     remove_parser = subparsers.add_parser("remove", help="Remove a project")
     remove_parser.add_argument("name", help="Project name")
     remove_parser.set_defaults(func=cmd_remove)
 
-    # list
+
+def _add_list_parser(subparsers) -> None:
     list_parser = subparsers.add_parser("list", help="List configured projects")
     list_parser.set_defaults(func=cmd_list)
 
-    # voices
+
+def _add_voices_parser(subparsers) -> None:
     voices_parser = subparsers.add_parser("voices", help="List available macOS voices")
     voices_parser.set_defaults(func=cmd_voices)
 
-    # check
+
+def _add_check_parser(subparsers) -> None:
     check_parser = subparsers.add_parser("check", help="Check system setup")
     check_parser.set_defaults(func=cmd_check)
 
-    # test-voice
+
+def _add_test_voice_parser(subparsers) -> None:
     test_parser = subparsers.add_parser("test-voice", help="Test voice output")
     test_parser.add_argument("text", nargs="?", help="Text to speak")
     test_parser.set_defaults(func=cmd_test_voice)
 
+
+# Subcommand name -> function that registers its parser, in help order
+SUBCOMMAND_BUILDERS: dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "start": _add_start_parser,
+    "init": _add_init_parser,
+    "add": _add_add_parser,
+    "remove": _add_remove_parser,
+    "list": _add_list_parser,
+    "voices": _add_voices_parser,
+    "check": _add_check_parser,
+    "test-voice": _add_test_voice_parser,
+}
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        prog="claude-voice",
+        description="Voice-controlled interface for Claude Code in Kitty terminal",
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # Only build the subparser being invoked; fall back to all of them for
+    # top-level help and unknown commands so argparse can list the choices.
+    sub = sys.argv[1] if len(sys.argv) > 1 and not sys.argv[1].startswith("-") else None
+    if sub in SUBCOMMAND_BUILDERS:
+        SUBCOMMAND_BUILDERS[sub](subparsers)
+    else:
+        for build in SUBCOMMAND_BUILDERS.values():
+            build(subparsers)
+
     args = parser.parse_args()
 
     if args.command is None:
@@ -1,14 +1,25 @@
 """Configuration management for Kitty Voice Controller."""
 
+import copy
+import marshal
 import os
-from dataclasses import dataclass, field
+import re
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
 
-CONFIG_DIR = Path.home() / ".config" / "claude-voice"
+
+_HOME = os.path.expanduser("~")
+CONFIG_DIR = Path(_HOME) / ".config" / "claude-voice"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 DEFAULT_CONFIG_TEMPLATE = """# Claude Voice Controller Configuration
 # ─────────────────────────────────────────────
@@ -26,6 +37,7 @@ projects:
 voice:
   hotkey: ctrl+shift+v            # push-to-talk key
   whisper_model: base             # tiny, base, small, medium, large
+  whisper_backend: whisper        # whisper, faster-whisper
   language: en
 
   tts_voice: Samantha             # macOS voice (run `say -v ?` to list)
@@ -55,6 +67,59 @@ commands: {}
 """
 
 
+# Parsed configs keyed by path, tagged with the (mtime_ns, size) they were read at
+_CFG_CACHE: dict[Path, tuple[int, int, "Config"]] = {}
+
+
+def _parse_cache_path(path: Path) -> Path:
+    """Get the path of the parse cache stored next to a config file."""
+    return path.with_name(path.name + ".cache")
+
+
+def _load_parsed(path: Path, st: os.stat_result) -> dict[str, Any] | None:
+    """Load the cached YAML data of a config file if it matches the current contents.
+
+    Only the plain parsed data is cached (with marshal, which can't run code
+    on load); it always goes through Config.from_dict, so the cache can't
+    hand back objects built by an older version of this module.
+    """
+    try:
+        with open(_parse_cache_path(path), "rb") as f:
+            mtime_ns, size, data = marshal.load(f)
+    except Exception:
+        return None
+
+    if (mtime_ns, size) != (st.st_mtime_ns, st.st_size) or not isinstance(data, dict):
+        return None
+    return data
+
+
+def _save_parsed(path: Path, st: os.stat_result, data: dict[str, Any]) -> None:
+    """Write the parsed YAML data next to its source file (best effort)."""
+    try:
+        payload = marshal.dumps((st.st_mtime_ns, st.st_size, data))
+    except ValueError:
+        return  # Data marshal can't store, such as YAML dates
+
+    # Swapped in whole so a concurrent load never sees a partial cache
+    cache_path = _parse_cache_path(path)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _expand_home(path: str) -> str:
+    """Expand a leading ~ using the home directory resolved at import."""
+    if path == "~" or path.startswith("~/"):
+        return _HOME + path[1:]
+    return os.path.expanduser(path)
+
+
 @dataclass
 class ProjectConfig:
     """Configuration for a single project."""
@@ -66,7 +131,7 @@ class ProjectConfig:
 
     @classmethod
     def from_dict(cls, name: str, data: dict[str, Any]) -> "ProjectConfig":
-        directory = Path(data.get("directory", "~/")).expanduser()
+        directory = Path(_expand_home(data.get("directory", "~/")))
         return cls(
             name=name,
             directory=directory,
@@ -85,6 +150,7 @@ class VoiceConfig:
 
     hotkey: str = "ctrl+shift+v"
     whisper_model: str = "base"
+    whisper_backend: str = "whisper"
     language: str = "en"
     tts_voice: str = "Samantha"
     tts_rate: int = 200
@@ -98,6 +164,7 @@ class VoiceConfig:
         return cls(
             hotkey=data.get("hotkey", "ctrl+shift+v"),
             whisper_model=data.get("whisper_model", "base"),
+            whisper_backend=data.get("whisper_backend", "whisper"),
             language=data.get("language", "en"),
             tts_voice=data.get("tts_voice", "Samantha"),
             tts_rate=data.get("tts_rate", 200),
@@ -155,19 +222,65 @@ class Config:
     summary: SummaryConfig = field(default_factory=SummaryConfig)
     layout: LayoutConfig = field(default_factory=LayoutConfig)
     commands: dict[str, dict[str, str]] = field(default_factory=dict)
+    _alias_index: dict[str, ProjectConfig] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _alias_prefix_re: re.Pattern[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._rebuild_alias_index()
+
+    def _rebuild_alias_index(self) -> None:
+        """Map every lowered project name and alias to its project.
+
+        Also compiles one matcher for a leading name or alias, longest first
+        so "front end" wins over "front".
+        """
+        self._alias_index = {}
+        for project in self.projects.values():
+            for name in project.get_all_names():
+                self._alias_index.setdefault(name, project)
+
+        names = sorted(self._alias_index, key=len, reverse=True)
+        self._alias_prefix_re = (
+            re.compile(r"^(" + "|".join(re.escape(n) for n in names) + r")\s+")
+            if names
+            else None
+        )
 
     @classmethod
     def load(cls, config_path: Path | None = None) -> "Config":
         """Load configuration from file."""
         path = config_path or CONFIG_FILE
 
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return cls()
 
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        cached = _CFG_CACHE.get(path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return copy.deepcopy(cached[2])
+
+        data = _load_parsed(path, st)
+        if data is None:
+            with open(path) as f:
+                data = yaml.load(f, Loader=_Loader) or {}
+            _save_parsed(path, st, data)
+
+        config = cls.from_dict(data)
 
-        return cls.from_dict(data)
+        _CFG_CACHE[path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(config))
+        return config
+
+    @staticmethod
+    def invalidate_cache(config_path: Path | None = None) -> None:
+        """Drop any cached parse of a config file, in memory and on disk."""
+        path = config_path or CONFIG_FILE
+        _CFG_CACHE.pop(path, None)
+        _parse_cache_path(path).unlink(missing_ok=True)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Config":
@@ -188,53 +301,53 @@ class Config:
         path = config_path or CONFIG_FILE
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        projects = {}
+        for name, proj in self.projects.items():
+            proj_data = asdict(proj)
+            del proj_data["name"]  # Stored as the mapping key
+            proj_data["directory"] = str(proj.directory)
+            projects[name] = proj_data
+
         data = {
-            "projects": {
-                name: {
-                    "directory": str(proj.directory),
-                    "command": proj.command,
-                    "voice_alias": proj.voice_alias,
-                }
-                for name, proj in self.projects.items()
-            },
-            "voice": {
-                "hotkey": self.voice.hotkey,
-                "whisper_model": self.voice.whisper_model,
-                "language": self.voice.language,
-                "tts_voice": self.voice.tts_voice,
-                "tts_rate": self.voice.tts_rate,
-                "volume": self.voice.volume,
-                "sound_listen_start": self.voice.sound_listen_start,
-                "sound_listen_stop": self.voice.sound_listen_stop,
-                "sound_error": self.voice.sound_error,
-            },
-            "summary": {
-                "max_spoken_length": self.summary.max_spoken_length,
-                "strategy": self.summary.strategy,
-                "announce_errors": self.summary.announce_errors,
-                "announce_questions": self.summary.announce_questions,
-                "announce_completion": self.summary.announce_completion,
-            },
-            "layout": {
-                "arrangement": self.layout.arrangement,
-                "window_width": self.layout.window_width,
-                "window_height": self.layout.window_height,
-            },
+            "projects": projects,
+            "voice": asdict(self.voice),
+            "summary": asdict(self.summary),
+            "layout": asdict(self.layout),
             "commands": self.commands,
         }
 
-        with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        # Write to a sibling temp file and swap it in so a crash can't leave a torn config
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                yaml.dump(
+                    data,
+                    f,
+                    Dumper=_Dumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                    allow_unicode=True,
+                    encoding="utf-8",
+                )
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        self.invalidate_cache(path)
 
     def find_project_by_voice(self, spoken_name: str) -> ProjectConfig | None:
         """Find a project by its name or voice alias."""
-        spoken_lower = spoken_name.lower().strip()
+        return self._alias_index.get(spoken_name.lower().strip())
 
-        for project in self.projects.values():
-            if spoken_lower in project.get_all_names():
-                return project
+    def match_project_prefix(self, text: str) -> tuple[ProjectConfig, int] | None:
+        """Find the project named or aliased at the start of lowercased text.
 
-        return None
+        Returns the project and the offset where the rest of the text begins.
+        """
+        match = self._alias_prefix_re.match(text) if self._alias_prefix_re else None
+        if match is None:
+            return None
+        return self._alias_index[match.group(1)], match.end()
 
     def add_project(
         self,
@@ -250,11 +363,13 @@ class Config:
             command=command,
             voice_alias=aliases or [],
         )
+        self._rebuild_alias_index()
 
     def remove_project(self, name: str) -> bool:
         """Remove a project by name."""
         if name in self.projects:
             del self.projects[name]
+            self._rebuild_alias_index()
             return True
         return False
 
@@ -1,5 +1,7 @@
 """Main controller that orchestrates voice input, output, and Kitty integration."""
 
+import asyncio
+import hashlib
 import re
 import threading
 import time
@@ -39,6 +41,21 @@ class VoiceController:
         "help": "speak_help",
     }
 
+    # Longest phrase first, matched as a whole word at the start of the utterance;
+    # a lookahead rather than requiring whitespace, so "Status." still matches
+    _GLOBAL_RE = re.compile(
+        r"^("
+        + "|".join(re.escape(k) for k in sorted(GLOBAL_COMMANDS, key=len, reverse=True))
+        + r")(?=\W|$)"
+    )
+
+    # Characters at the end of a window's output hashed to detect changes
+    SIGNATURE_TAIL_CHARS = 4096
+
+    # Output polling: interval doubles per unchanged poll, resets on change
+    MONITOR_MIN_INTERVAL = 1.0
+    MONITOR_MAX_INTERVAL = 8.0
+
     # Window-specific commands
     WINDOW_COMMANDS = {
         "stop": "send_interrupt",
@@ -54,11 +71,38 @@ class VoiceController:
         self.sound_player = SoundPlayer(self.config.voice)
         self.summarizer = OutputSummarizer(self.config.summary)
 
-        self._running = False
+        # Set when the controller should stop; everything waits on it instead of polling
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self._muted = False
         self._ptt_handler: PushToTalkHandler | None = None
-        self._monitor_thread: threading.Thread | None = None
-        self._last_outputs: dict[str, str] = {}
+        # Event loop running the output monitor, and its in-loop stop signal
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._async_stop: asyncio.Event | None = None
+        # Per window: (output length, hash of output tail) and whether the prompt was showing
+        self._last_sigs: dict[str, tuple[int, bytes]] = {}
+        self._last_ready: dict[str, bool] = {}
+        self._poll_interval: dict[str, float] = {}
+        self._next_poll: dict[str, float] = {}
+
+        # Resolve command phrases to bound methods once
+        self._global_dispatch: dict[str, Callable[[], None]] = {
+            phrase: getattr(self, method_name)
+            for phrase, method_name in self.GLOBAL_COMMANDS.items()
+            if hasattr(self, method_name)
+        }
+        window_handlers: dict[str, Callable[[str, KittyWindow], None]] = {
+            "send_interrupt": self._interrupt_window,
+            "read_output": self._read_window_output,
+            "focus_window": self._focus_window,
+        }
+        self._window_dispatch = {
+            phrase: window_handlers[action] for phrase, action in self.WINDOW_COMMANDS.items()
+        }
+
+    @property
+    def _running(self) -> bool:
+        return not self._stop_event.is_set()
 
     def start(self, project_names: list[str] | None = None) -> bool:
         """Start the voice controller.
@@ -100,10 +144,8 @@ class VoiceController:
         )
         self._ptt_handler.start()
 
-        # Start output monitor
-        self._running = True
-        self._monitor_thread = threading.Thread(target=self._monitor_outputs, daemon=True)
-        self._monitor_thread.start()
+        # Output monitoring starts with the event loop in run()
+        self._stop_event.clear()
 
         # Announce ready
         projects = ", ".join(self.kitty.windows.keys())
@@ -122,16 +164,39 @@ class VoiceController:
             return
 
         try:
-            while self._running:
-                time.sleep(0.1)
+            asyncio.run(self._run_async())
         except KeyboardInterrupt:
             print("\nShutting down...")
         finally:
             self.stop()
 
+    async def _run_async(self) -> None:
+        """Monitor window outputs on the event loop until stopped."""
+        self._loop = asyncio.get_running_loop()
+        self._async_stop = asyncio.Event()
+        if self._stop_event.is_set():
+            self._async_stop.set()
+
+        monitor = asyncio.create_task(self._monitor_outputs())
+        try:
+            await self._async_stop.wait()
+        finally:
+            monitor.cancel()
+            self._loop = None
+
+    def _request_stop(self) -> None:
+        """Signal everything waiting on the controller to stop (thread-safe)."""
+        self._stop_event.set()
+        loop, async_stop = self._loop, self._async_stop
+        if loop and async_stop:
+            try:
+                loop.call_soon_threadsafe(async_stop.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
     def stop(self) -> None:
         """Stop the voice controller."""
-        self._running = False
+        self._request_stop()
 
         if self._ptt_handler:
             self._ptt_handler.stop()
@@ -141,6 +206,8 @@ class VoiceController:
 
     def _on_listen_start(self) -> None:
         """Called when push-to-talk is activated."""
+        # Talking over an announcement cuts it off
+        self.voice_output.interrupt()
         self.sound_player.play_listen_start()
 
     def _on_listen_stop(self) -> None:
@@ -163,33 +230,32 @@ class VoiceController:
 
     def _parse_command(self, text: str) -> ParsedCommand:
         """Parse a voice command to extract target and action."""
-        text_lower = text.lower().strip()
+        # Normalize once; match offsets in text_lower line up with text unless
+        # lowercasing changed the length (rare non-ASCII cases)
+        text = text.strip()
+        text_lower = text.lower()
+        source = text if len(text_lower) == len(text) else text_lower
 
         # Check for global commands first
-        for cmd_phrase in self.GLOBAL_COMMANDS:
-            if text_lower.startswith(cmd_phrase) or text_lower == cmd_phrase:
-                return ParsedCommand(target=None, command=cmd_phrase, is_global=True)
+        match = self._GLOBAL_RE.match(text_lower)
+        if match:
+            return ParsedCommand(target=None, command=match.group(1), is_global=True)
 
         # Look for project name pattern: "project: command" or "project command"
         # Try colon separator first
-        if ":" in text:
-            parts = text.split(":", 1)
-            target_phrase = parts[0].strip()
-            command = parts[1].strip() if len(parts) > 1 else ""
-
-            project = self.config.find_project_by_voice(target_phrase)
+        colon = text_lower.find(":")
+        if colon >= 0:
+            project = self.config.find_project_by_voice(text_lower[:colon])
             if project:
+                command = source[colon + 1:].strip()
                 return ParsedCommand(target=project.name, command=command, is_global=False)
 
         # Try to find project name at the start
-        for project in self.config.projects.values():
-            for name in project.get_all_names():
-                # Check if text starts with project name
-                pattern = rf"^{re.escape(name)}\s+"
-                match = re.match(pattern, text_lower)
-                if match:
-                    command = text[match.end():].strip()
-                    return ParsedCommand(target=project.name, command=command, is_global=False)
+        found = self.config.match_project_prefix(text_lower)
+        if found:
+            project, end = found
+            command = source[end:].strip()
+            return ParsedCommand(target=project.name, command=command, is_global=False)
 
         # No target found, might be a bare command for the active window
         # For now, report as unparseable
@@ -197,9 +263,9 @@ class VoiceController:
 
     def _execute_global_command(self, command: str) -> None:
         """Execute a global command."""
-        method_name = self.GLOBAL_COMMANDS.get(command.lower())
-        if method_name and hasattr(self, method_name):
-            getattr(self, method_name)()
+        handler = self._global_dispatch.get(command.lower())
+        if handler:
+            handler()
 
     def _execute_window_command(self, project_name: str, command: str) -> None:
         """Execute a command for a specific window."""
@@ -211,15 +277,9 @@ class VoiceController:
         command_lower = command.lower().strip()
 
         # Check for window-specific built-in commands
-        if command_lower in self.WINDOW_COMMANDS:
-            method_name = self.WINDOW_COMMANDS[command_lower]
-            if method_name == "send_interrupt":
-                window.send_interrupt()
-                self.speak(f"Sent stop signal to {project_name}.")
-            elif method_name == "read_output":
-                self._read_window_output(project_name, window)
-            elif method_name == "focus":
-                window.focus()
+        handler = self._window_dispatch.get(command_lower)
+        if handler:
+            handler(project_name, window)
             return
 
         # Check for custom commands from config
@@ -235,73 +295,142 @@ class VoiceController:
         window.send_command(command)
         self.speak(f"Sent to {project_name}.")
 
+    def _interrupt_window(self, project_name: str, window: KittyWindow) -> None:
+        """Send Ctrl+C to the window."""
+        window.send_interrupt()
+        self.speak(f"Sent stop signal to {project_name}.")
+
+    def _focus_window(self, project_name: str, window: KittyWindow) -> None:
+        """Bring the window to the foreground."""
+        window.focus()
+
     def _read_window_output(self, project_name: str, window: KittyWindow) -> None:
         """Read and speak the window's current output."""
         output = window.get_text()
         summary = self.summarizer.summarize(output)
         self.speak(f"{project_name}: {summary.text}")
 
-    def _monitor_outputs(self) -> None:
-        """Background thread to monitor window outputs for completion."""
+    async def _monitor_outputs(self) -> None:
+        """Monitor window outputs for completion.
+
+        Each window is polled on its own schedule: every second while output
+        is changing, backing off to every few seconds while it's idle. The
+        windows that are due are fetched and checked together on a worker
+        thread, so the event loop never waits on kitty or the summarizer.
+        """
         while self._running:
-            for name, window in self.kitty.windows.items():
-                try:
-                    current_output = window.get_text()
+            now = time.monotonic()
+            due = [
+                name for name in list(self.kitty.windows) if self._next_poll.get(name, 0.0) <= now
+            ]
+            changes = await asyncio.to_thread(self._poll_windows, due) if due else {}
+
+            for name in due:
+                if changes.get(name, False):
+                    interval = self.MONITOR_MIN_INTERVAL
+                else:
+                    interval = min(
+                        self._poll_interval.get(name, self.MONITOR_MIN_INTERVAL) * 2,
+                        self.MONITOR_MAX_INTERVAL,
+                    )
+                self._poll_interval[name] = interval
+                self._next_poll[name] = time.monotonic() + interval
+
+            # Sleep until the next window is due (re-check at least every
+            # MONITOR_MIN_INTERVAL so newly launched windows get picked up)
+            next_poll = min(self._next_poll.values(), default=now)
+            await asyncio.sleep(
+                min(max(next_poll - time.monotonic(), 0.0), self.MONITOR_MIN_INTERVAL)
+            )
+
+    def _poll_windows(self, names: list[str]) -> dict[str, bool]:
+        """Fetch the windows' output in one batch and check it. Returns which changed."""
+        try:
+            outputs = self.kitty.get_texts(names=names)
+        except Exception:
+            return {}  # Ignore monitoring errors
+
+        changes = {}
+        for name, output in outputs.items():
+            try:
+                changes[name] = self._check_output(name, output)
+            except Exception:
+                changes[name] = False  # Ignore monitoring errors
+        return changes
+
+    def _check_output(self, name: str, current_output: str) -> bool:
+        """Process a window's latest output. Returns True if it changed."""
+        # Check if output has changed
+        sig = self._output_signature(current_output)
+        last_len, last_hash = self._last_sigs.get(name, (0, b""))
+        if sig == (last_len, last_hash):
+            return False
+        self._last_sigs[name] = sig
 
-                    # Check if output has changed
-                    last_output = self._last_outputs.get(name, "")
-                    if current_output != last_output:
-                        self._last_outputs[name] = current_output
+        # Check if Claude finished (prompt visible)
+        ready = self._is_claude_ready(current_output)
+        was_ready = self._last_ready.get(name, False)
+        self._last_ready[name] = ready
+        if ready and not was_ready:
+            # Claude just finished
+            self._announce_completion(name, current_output, (last_len, last_hash))
 
-                        # Check if Claude finished (prompt visible)
-                        if self._is_claude_ready(current_output) and not self._is_claude_ready(last_output):
-                            # Claude just finished
-                            self._announce_completion(name, current_output, last_output)
+        return True
 
-                except Exception as e:
-                    pass  # Ignore monitoring errors
+    def _output_signature(self, output: str) -> tuple[int, bytes]:
+        """Cheap change signature for window output: length plus a hash of its tail."""
+        return len(output), self._tail_hash(output)
 
-            time.sleep(1)  # Check every second
+    def _tail_hash(self, text: str) -> bytes:
+        tail = text[-self.SIGNATURE_TAIL_CHARS:]
+        return hashlib.blake2b(tail.encode(), digest_size=8).digest()
 
     def _is_claude_ready(self, output: str) -> bool:
         """Check if Claude Code prompt is visible (ready for input)."""
-        lines = output.strip().split("\n")
-        if not lines:
-            return False
-
-        last_line = lines[-1].strip()
+        # Only the last non-blank line matters; avoid splitting the whole buffer
+        output = output.rstrip()
+        last_line = output[output.rfind("\n") + 1:].strip()
         # Claude Code shows "> " prompt when ready
         return last_line.endswith(">") or "> " in last_line
 
-    def _announce_completion(self, project_name: str, current_output: str, last_output: str) -> None:
+    def _announce_completion(
+        self, project_name: str, current_output: str, last_sig: tuple[int, bytes]
+    ) -> None:
         """Announce when Claude completes a task."""
         if not self.config.summary.announce_completion:
             return
 
-        # Get just the new output
+        # Get just the new output if the old output is still its prefix; the
+        # screen scrolls, so otherwise (or if it did not grow) use everything
         new_output = current_output
-        if last_output and last_output in current_output:
-            idx = current_output.find(last_output)
-            if idx >= 0:
-                new_output = current_output[idx + len(last_output):]
+        last_length, last_hash = last_sig
+        if 0 < last_length < len(current_output):
+            start = max(last_length - self.SIGNATURE_TAIL_CHARS, 0)
+            if self._tail_hash(current_output[start:last_length]) == last_hash:
+                new_output = current_output[last_length:]
 
         summary = self.summarizer.summarize(new_output)
 
         # Only announce if there's meaningful content
         if summary.raw_length > 50 or summary.has_error or summary.has_question:
-            self.speak(f"{project_name}: {summary.text}")
+            self.speak_async(f"{project_name}: {summary.text}")
 
     def speak(self, text: str) -> None:
         """Speak text if not muted."""
         if not self._muted:
             self.voice_output.speak(text)
 
+    def speak_async(self, text: str) -> None:
+        """Speak text in the background, after earlier async speech, if not muted."""
+        if not self._muted:
+            self.voice_output.speak_async(text)
+
     # Global command implementations
     def get_all_status(self) -> None:
         """Report status of all windows."""
         status_parts = []
-        for name, window in self.kitty.windows.items():
-            state = "busy" if window.is_busy() else "ready"
+        for name, window_status in self.kitty.get_all_status().items():
+            state = "busy" if window_status["busy"] else "ready"
             status_parts.append(f"{name} is {state}")
 
         self.speak(". ".join(status_parts))
@@ -330,7 +459,7 @@ class VoiceController:
 
     def shutdown(self) -> None:
         """Shutdown the voice controller."""
-        self._running = False
+        self._request_stop()
 
     def speak_help(self) -> None:
         """Speak help information."""
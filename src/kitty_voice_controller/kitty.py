@@ -1,33 +1,239 @@
 """Kitty terminal integration via remote control."""
 
+import asyncio
+import base64
+import functools
 import json
+import os
+import socket
 import subprocess
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Iterable
 
 from .config import Config, LayoutConfig, ProjectConfig
 
 
+class KittyRPCError(Exception):
+    """Kitty rejected a remote control command, or never answered it."""
+
+
+class KittyRPC:
+    """Persistent connection to Kitty's remote control socket.
+
+    Speaks the framed JSON protocol that `kitty @` uses, so a command is a
+    write and a read on an already-open socket instead of a new process.
+    The connection is reopened transparently if Kitty closes it.
+
+    OSError means a command never reached Kitty, so it's safe to retry it
+    with `kitty @`. Once a command has been sent, failures (including a
+    timeout waiting for the reply) raise KittyRPCError instead: Kitty may
+    have run it, and running send-text twice would type the text twice.
+    """
+
+    PREFIX = b"\x1bP@kitty-cmd"
+    SUFFIX = b"\x1b\\"
+    VERSION = [0, 26, 0]
+
+    def __init__(self, address: str, timeout: float = 5.0):
+        self.address = address
+        self.timeout = timeout
+        self._sock: socket.socket | None = None
+        self._buffer = b""
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "KittyRPC | None":
+        """Create a client for $KITTY_LISTEN_ON, if it's a unix socket."""
+        listen_on = os.environ.get("KITTY_LISTEN_ON", "")
+        if not listen_on.startswith("unix:"):
+            return None
+        address = listen_on[len("unix:"):]
+        if address.startswith("@"):  # Linux abstract socket
+            address = "\0" + address[1:]
+        return cls(address)
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.address)
+            except OSError:
+                sock.close()
+                raise
+            self._sock = sock
+            self._buffer = b""
+        return self._sock
+
+    def close(self) -> None:
+        """Close the connection (it will be reopened on next use)."""
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        self._buffer = b""
+
+    def _encode(self, cmd: str, payload: dict[str, Any] | None) -> bytes:
+        message = {"cmd": cmd, "version": self.VERSION, "no_response": False}
+        if payload is not None:
+            message["payload"] = payload
+        return self.PREFIX + json.dumps(message).encode() + self.SUFFIX
+
+    def _read_response(self, sock: socket.socket) -> dict[str, Any]:
+        while True:
+            start = self._buffer.find(self.PREFIX)
+            end = self._buffer.find(self.SUFFIX, start + 1) if start >= 0 else -1
+            if end >= 0:
+                body = self._buffer[start + len(self.PREFIX):end]
+                self._buffer = self._buffer[end + len(self.SUFFIX):]
+                try:
+                    return json.loads(body)
+                except ValueError as e:
+                    raise KittyRPCError(f"Malformed response from Kitty: {e}") from e
+
+            chunk = sock.recv(65536)
+            if not chunk:
+                raise ConnectionResetError("Kitty closed the remote control connection")
+            self._buffer += chunk
+
+    def _roundtrip(self, request: bytes) -> dict[str, Any]:
+        """Send one request and read its response."""
+        try:
+            return self._send_and_read(request)
+        except ConnectionError:
+            # Kitty may have closed an idle connection; reconnect and retry once
+            return self._send_and_read(request)
+
+    def _send_and_read(self, request: bytes) -> dict[str, Any]:
+        reused = self._sock is not None
+        try:
+            sock = self._connect()
+            sock.sendall(request)
+        except OSError:
+            self._close()
+            raise
+
+        try:
+            return self._read_response(sock)
+        except OSError as e:
+            got_reply = bool(self._buffer)
+            self._close()
+            if reused and not got_reply and isinstance(e, ConnectionResetError):
+                # An idle connection Kitty had already closed, so it never read the request
+                raise
+            raise KittyRPCError(f"No response from Kitty: {e}") from e
+
+    def batch(self, calls: list[tuple[str, dict[str, Any] | None]]) -> list[dict[str, Any]]:
+        """Run several commands back to back over the connection.
+
+        Returns the raw response dicts (``{"ok": ..., "data"/"error": ...}``)
+        in order. Raises OSError if Kitty can't be reached before any command
+        is sent, and KittyRPCError if the connection fails part way.
+        """
+        with self._lock:
+            responses = []
+            for cmd, payload in calls:
+                try:
+                    responses.append(self._roundtrip(self._encode(cmd, payload)))
+                except OSError as e:
+                    if not responses:
+                        raise
+                    raise KittyRPCError(
+                        f"Lost the connection to Kitty after {len(responses)} commands: {e}"
+                    ) from e
+            return responses
+
+    def call(self, cmd: str, payload: dict[str, Any] | None = None) -> Any:
+        """Run a single command and return its response data.
+
+        Raises:
+            KittyRPCError: If Kitty reports the command failed, or doesn't reply to it
+            OSError: If Kitty can't be reached (the command was not sent)
+        """
+        response = self.batch([(cmd, payload)])[0]
+        if not response.get("ok"):
+            raise KittyRPCError(response.get("error", f"kitty @ {cmd} failed"))
+        return response.get("data")
+
+
 @dataclass
 class KittyWindow:
     """Represents a Kitty OS window."""
 
     title: str
     pid: int | None = None
+    rpc: KittyRPC | None = None
+    # Seconds a get_text() result is reused; sending text invalidates it
+    text_cache_ttl: float = 0.5
+    _text_cache: dict[str, tuple[float, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @property
+    def match(self) -> str:
+        """Kitty match expression selecting this window."""
+        return f"title:^{self.title}$"
+
+    def cached_text(self, extent: str = "screen") -> str | None:
+        """Get recently fetched text for an extent, if still fresh."""
+        cached = self._text_cache.get(extent)
+        if cached and time.monotonic() - cached[0] < self.text_cache_ttl:
+            return cached[1]
+        return None
+
+    def cache_text(self, extent: str, text: str) -> str:
+        """Remember fetched text for an extent and return it."""
+        self._text_cache[extent] = (time.monotonic(), text)
+        return text
 
     def send_text(self, text: str) -> bool:
         """Send text to this window."""
+        self._text_cache.clear()
+        if self.rpc:
+            try:
+                self.rpc.call("send-text", self._send_text_payload(text))
+                return True
+            except KittyRPCError:
+                return False
+            except OSError:
+                pass  # Fall back to kitty @
         try:
+            # Text goes over stdin so large payloads can't hit the argv size limit
             subprocess.run(
-                ["kitty", "@", "send-text", "--match", f"title:^{self.title}$", text],
+                self._send_text_argv(),
+                input=text.encode(),
                 check=True,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             return True
         except subprocess.CalledProcessError:
             return False
 
+    async def send_text_async(self, text: str) -> bool:
+        """Send text to this window via `kitty @` without blocking the event loop."""
+        self._text_cache.clear()
+        process = await asyncio.create_subprocess_exec(
+            *self._send_text_argv(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        await process.communicate(text.encode())
+        return process.returncode == 0
+
+    def _send_text_payload(self, text: str) -> dict[str, Any]:
+        return {"match": self.match, "data": "base64:" + base64.b64encode(text.encode()).decode()}
+
+    def _send_text_argv(self) -> list[str]:
+        return ["kitty", "@", "send-text", "--match", self.match, "--stdin"]
+
     def send_command(self, command: str) -> bool:
         """Send a command (text + newline) to this window."""
         return self.send_text(command + "\n")
@@ -42,28 +248,53 @@ class KittyWindow:
         Args:
             extent: 'screen', 'all', 'selection', or 'first_cmd_output_on_screen'
         """
+        cached = self.cached_text(extent)
+        if cached is not None:
+            return cached
+
+        if self.rpc:
+            try:
+                return self.cache_text(
+                    extent, self.rpc.call("get-text", self._get_text_payload(extent)) or ""
+                )
+            except KittyRPCError:
+                return ""
+            except OSError:
+                pass  # Fall back to kitty @
         try:
             result = subprocess.run(
                 [
                     "kitty", "@", "get-text",
-                    "--match", f"title:^{self.title}$",
+                    "--match", self.match,
                     "--extent", extent,
                 ],
                 check=True,
                 capture_output=True,
                 text=True,
             )
-            return result.stdout
+            return self.cache_text(extent, result.stdout)
         except subprocess.CalledProcessError:
             return ""
 
+    def _get_text_payload(self, extent: str) -> dict[str, Any]:
+        return {"match": self.match, "extent": extent}
+
     def focus(self) -> bool:
         """Bring this window to focus."""
+        if self.rpc:
+            try:
+                self.rpc.call("focus-window", {"match": self.match})
+                return True
+            except KittyRPCError:
+                return False
+            except OSError:
+                pass  # Fall back to kitty @
         try:
             subprocess.run(
-                ["kitty", "@", "focus-window", "--match", f"title:^{self.title}$"],
+                ["kitty", "@", "focus-window", "--match", self.match],
                 check=True,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             return True
         except subprocess.CalledProcessError:
@@ -71,12 +302,13 @@ class KittyWindow:
 
     def is_busy(self) -> bool:
         """Check if the window appears to be busy (no prompt visible)."""
-        text = self.get_text()
-        lines = text.strip().split("\n")
-        if not lines:
-            return False
+        return self.text_is_busy(self.get_text())
 
-        last_line = lines[-1].strip()
+    @staticmethod
+    def text_is_busy(text: str) -> bool:
+        """Check if window text looks busy (no prompt on the last line)."""
+        # Only the last line matters; find it without splitting the whole text
+        last_line = text.rstrip().rpartition("\n")[2].strip()
         # Claude Code shows a prompt like "> " when ready
         # This is a heuristic - adjust based on actual behavior
         return not (last_line.endswith(">") or last_line.endswith("$"))
@@ -85,9 +317,14 @@ class KittyWindow:
 class KittyController:
     """Controls Kitty terminal windows."""
 
+    # Seconds to let newly launched windows start before talking to them
+    LAUNCH_SETTLE_SECONDS = 0.5
+
     def __init__(self, config: Config):
         self.config = config
         self.windows: dict[str, KittyWindow] = {}
+        # Shared remote control connection; None means use `kitty @` per call
+        self.rpc = KittyRPC.from_env()
 
     @staticmethod
     def is_kitty_running() -> bool:
@@ -95,7 +332,8 @@ class KittyController:
         try:
             result = subprocess.run(
                 ["pgrep", "-x", "kitty"],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             return result.returncode == 0
         except Exception:
@@ -107,20 +345,21 @@ class KittyController:
         try:
             result = subprocess.run(
                 ["kitty", "@", "ls"],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5,
             )
             return result.returncode == 0
         except Exception:
             return False
 
-    def launch_window(
+    async def launch_window_async(
         self,
         project: ProjectConfig,
         layout: LayoutConfig,
         position: tuple[int, int] | None = None,
     ) -> KittyWindow | None:
-        """Launch a new Kitty OS window for a project."""
+        """Launch a new Kitty OS window for a project without waiting for it to start."""
         title = f"claude-{project.name}"
 
         cmd = [
@@ -139,61 +378,74 @@ class KittyController:
         cmd.extend(["-e", "bash", "-c", f"{project.command}; exec bash"])
 
         try:
-            process = subprocess.Popen(
+            # Popen in a worker thread rather than create_subprocess_exec: the
+            # window outlives the event loop, so it must not be tied to it
+            process = await asyncio.to_thread(
+                subprocess.Popen,
                 cmd,
                 start_new_session=True,
             )
-            window = KittyWindow(title=title, pid=process.pid)
+            window = KittyWindow(title=title, pid=process.pid, rpc=self.rpc)
             self.windows[project.name] = window
-
-            # Give window time to start
-            time.sleep(0.5)
             return window
 
         except Exception as e:
             print(f"Failed to launch window for {project.name}: {e}")
             return None
 
-    def launch_all_projects(self) -> dict[str, KittyWindow]:
-        """Launch windows for all configured projects."""
+    def launch_window(
+        self,
+        project: ProjectConfig,
+        layout: LayoutConfig,
+        position: tuple[int, int] | None = None,
+    ) -> KittyWindow | None:
+        """Launch a new Kitty OS window for a project."""
+        window = asyncio.run(self.launch_window_async(project, layout, position))
+        if window:
+            # Give window time to start
+            time.sleep(self.LAUNCH_SETTLE_SECONDS)
+        return window
+
+    async def _launch_many(self, projects: list[ProjectConfig]) -> dict[str, KittyWindow]:
+        """Launch windows for several projects concurrently."""
         positions = self._calculate_positions()
+        windows = await asyncio.gather(
+            *(
+                self.launch_window_async(
+                    project,
+                    self.config.layout,
+                    positions[i] if i < len(positions) else None,
+                )
+                for i, project in enumerate(projects)
+            )
+        )
+        launched = {project.name: window for project, window in zip(projects, windows) if window}
 
-        for i, (name, project) in enumerate(self.config.projects.items()):
-            pos = positions[i] if i < len(positions) else None
-            window = self.launch_window(project, self.config.layout, pos)
-            if window:
-                self.windows[name] = window
-                # Stagger launches slightly
-                time.sleep(0.3)
+        if launched:
+            # Give the windows time to start (once for the whole batch)
+            await asyncio.sleep(self.LAUNCH_SETTLE_SECONDS)
+        return launched
 
+    def launch_all_projects(self) -> dict[str, KittyWindow]:
+        """Launch windows for all configured projects."""
+        # launch_window_async registers each window in self.windows
+        asyncio.run(self._launch_many(list(self.config.projects.values())))
         return self.windows
 
     def launch_projects(self, project_names: list[str]) -> dict[str, KittyWindow]:
         """Launch windows for specific projects."""
-        positions = self._calculate_positions()
-        launched = {}
-
-        for i, name in enumerate(project_names):
+        projects = []
+        for name in project_names:
             if name not in self.config.projects:
                 print(f"Project '{name}' not found in config")
                 continue
+            projects.append(self.config.projects[name])
 
-            project = self.config.projects[name]
-            pos = positions[i] if i < len(positions) else None
-            window = self.launch_window(project, self.config.layout, pos)
-            if window:
-                self.windows[name] = window
-                launched[name] = window
-                time.sleep(0.3)
-
-        return launched
-
-    def _calculate_positions(self) -> list[tuple[int, int]]:
-        """Calculate window positions based on layout arrangement."""
-        layout = self.config.layout
-        num_projects = len(self.config.projects)
+        return asyncio.run(self._launch_many(projects))
 
-        # Get screen dimensions (approximate for macOS)
+    @functools.cached_property
+    def _screen_dims(self) -> tuple[int, int]:
+        """Main display resolution (approximate for macOS), queried once per controller."""
         try:
             result = subprocess.run(
                 ["system_profiler", "SPDisplaysDataType", "-json"],
@@ -206,6 +458,14 @@ class KittyController:
             screen_width, screen_height = map(int, resolution.split(" ")[0].split("x"))
         except Exception:
             screen_width, screen_height = 1920, 1080
+        return screen_width, screen_height
+
+    def _calculate_positions(self) -> list[tuple[int, int]]:
+        """Calculate window positions based on layout arrangement."""
+        layout = self.config.layout
+        num_projects = len(self.config.projects)
+
+        screen_width, screen_height = self._screen_dims
 
         positions = []
         w, h = layout.window_width, layout.window_height
@@ -245,24 +505,102 @@ class KittyController:
             return window.send_command(text)
         return False
 
+    def get_texts(
+        self, extent: str = "screen", names: Iterable[str] | None = None
+    ) -> dict[str, str]:
+        """Get the text of every window, or just the named ones.
+
+        Batched over one connection when possible.
+        """
+        if names is None:
+            names = list(self.windows)
+        texts = {}
+        stale = []
+        for name in names:
+            window = self.windows.get(name)
+            if window is None:
+                continue
+            cached = window.cached_text(extent)
+            if cached is None:
+                stale.append((name, window))
+            else:
+                texts[name] = cached
+
+        if self.rpc and stale:
+            try:
+                responses = self.rpc.batch(
+                    [("get-text", window._get_text_payload(extent)) for _, window in stale]
+                )
+                for (name, window), response in zip(stale, responses):
+                    texts[name] = (
+                        window.cache_text(extent, response.get("data") or "")
+                        if response.get("ok")
+                        else ""
+                    )
+                return texts
+            except (OSError, KittyRPCError):
+                pass  # Fall back to kitty @ (reading text again is harmless)
+
+        for name, window in stale:
+            texts[name] = window.get_text(extent)
+        return texts
+
     def get_all_status(self) -> dict[str, dict]:
         """Get status of all windows."""
+        texts = self.get_texts()
         status = {}
         for name, window in self.windows.items():
             status[name] = {
                 "title": window.title,
-                "busy": window.is_busy(),
+                "busy": KittyWindow.text_is_busy(texts.get(name, "")),
             }
         return status
 
     def close_all(self) -> None:
         """Send exit command to all windows."""
-        for window in self.windows.values():
-            window.send_command("/exit")
-            time.sleep(0.2)
+        self.send_to_all("/exit\n")
+
+        if self.rpc:
+            self.rpc.close()
+
+    def send_to_all(self, text: str) -> None:
+        """Send the same text to every window at once.
+
+        Kitty handles remote control commands one at a time, so they are
+        pipelined over the socket, or run as concurrent `kitty @` processes.
+        """
+        windows = list(self.windows.values())
+        if not windows:
+            return
+
+        if self.rpc:
+            for window in windows:
+                window._text_cache.clear()
+            try:
+                self.rpc.batch(
+                    [("send-text", window._send_text_payload(text)) for window in windows]
+                )
+                return
+            except KittyRPCError:
+                return  # Some of it may have been sent; don't type it twice
+            except OSError:
+                pass  # Fall back to kitty @
+        asyncio.run(self._send_to_all_async(windows, text))
+
+    async def _send_to_all_async(self, windows: list[KittyWindow], text: str) -> None:
+        await asyncio.gather(
+            *(window.send_text_async(text) for window in windows), return_exceptions=True
+        )
 
     def list_kitty_windows(self) -> list[dict]:
         """List all current Kitty windows."""
+        if self.rpc:
+            try:
+                return json.loads(self.rpc.call("ls", {}) or "[]")
+            except (KittyRPCError, ValueError):
+                return []
+            except OSError:
+                pass  # Fall back to kitty @
         try:
             result = subprocess.run(
                 ["kitty", "@", "ls"],
@@ -283,7 +621,9 @@ def check_kitty_setup() -> tuple[bool, str]:
     """
     # Check if kitty is installed
     try:
-        subprocess.run(["which", "kitty"], check=True, capture_output=True)
+        subprocess.run(
+            ["which", "kitty"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
     except subprocess.CalledProcessError:
         return False, "Kitty terminal is not installed. Install with: brew install --cask kitty"
 
@@ -62,10 +62,36 @@ class OutputSummarizer:
         r"> $",  # Claude Code prompt
     ]
 
+    # Verbs that start an action statement ("Created foo.py.")
+    ACTION_VERBS = [
+        "Created",
+        "Updated",
+        "Added",
+        "Removed",
+        "Fixed",
+        "Installed",
+        "Running",
+        "Building",
+    ]
+
+    # Each pattern list combined into one alternation so text is scanned once
+    _ERROR_RE = re.compile("|".join(f"(?:{p})" for p in ERROR_PATTERNS), re.IGNORECASE)
+    _ERROR_LINE_RE = re.compile(f"(?:{_ERROR_RE.pattern}).*", re.IGNORECASE)
+    _QUESTION_RE = re.compile(
+        "|".join(f"(?:{p})" for p in QUESTION_PATTERNS), re.IGNORECASE | re.MULTILINE
+    )
+    _COMPLETION_RE = re.compile("|".join(f"(?:{p})" for p in COMPLETION_PATTERNS), re.IGNORECASE)
+    _ACTION_RE = re.compile(rf"((?:{'|'.join(ACTION_VERBS)}) .+?\.)", re.IGNORECASE)
+
     # Patterns to extract key information
     FILE_PATTERN = r"(?:(?:Created|Modified|Updated|Edited|Deleted|Reading|Writing)\s+)?([a-zA-Z0-9_\-./]+\.[a-zA-Z0-9]+)"
     COUNT_PATTERN = r"(\d+)\s+(?:files?|changes?|errors?|warnings?|tests?|passed|failed)"
 
+    _FILE_RE = re.compile(FILE_PATTERN)
+
+    # Plain output shorter than this is spoken as-is by the smart strategy
+    SHORT_TEXT_CHARS = 200
+
     def __init__(self, config: SummaryConfig):
         self.config = config
 
@@ -80,18 +106,21 @@ class OutputSummarizer:
                 raw_length=0,
             )
 
+        # Split once and share the lines with every pass that needs them
+        lines = text.strip().splitlines()
+
         # Detect characteristics
         has_error = self._has_error(text)
         has_question = self._has_question(text)
-        is_complete = self._is_complete(text)
+        is_complete = self._is_complete(lines)
 
         # Generate summary based on strategy
         if self.config.strategy == "full":
             summary_text = self._truncate_to_words(text, self.config.max_spoken_length)
         elif self.config.strategy == "first_last":
-            summary_text = self._first_last_summary(text)
+            summary_text = self._first_last_summary(lines)
         else:  # smart
-            summary_text = self._smart_summary(text, has_error, has_question, is_complete)
+            summary_text = self._smart_summary(text, lines, has_error, has_question, is_complete)
 
         return Summary(
             text=summary_text,
@@ -103,20 +132,18 @@ class OutputSummarizer:
 
     def _has_error(self, text: str) -> bool:
         """Check if output contains errors."""
-        text_lower = text.lower()
-        return any(re.search(p, text, re.IGNORECASE) for p in self.ERROR_PATTERNS)
+        return self._ERROR_RE.search(text) is not None
 
     def _has_question(self, text: str) -> bool:
         """Check if output contains a question."""
-        return any(re.search(p, text, re.IGNORECASE | re.MULTILINE) for p in self.QUESTION_PATTERNS)
+        return self._QUESTION_RE.search(text) is not None
 
-    def _is_complete(self, text: str) -> bool:
+    def _is_complete(self, lines: list[str]) -> bool:
         """Check if output indicates completion."""
-        lines = text.strip().split("\n")
         if not lines:
             return False
         last_lines = "\n".join(lines[-3:])
-        return any(re.search(p, last_lines, re.IGNORECASE) for p in self.COMPLETION_PATTERNS)
+        return self._COMPLETION_RE.search(last_lines) is not None
 
     def _truncate_to_words(self, text: str, max_words: int) -> str:
         """Truncate text to a maximum number of words."""
@@ -125,9 +152,9 @@ class OutputSummarizer:
             return text
         return " ".join(words[:max_words]) + "..."
 
-    def _first_last_summary(self, text: str) -> str:
+    def _first_last_summary(self, lines: list[str]) -> str:
         """Create summary from first and last lines."""
-        lines = [l.strip() for l in text.strip().split("\n") if l.strip()]
+        lines = [l.strip() for l in lines if l.strip()]
         if len(lines) <= 4:
             return " ".join(lines)
 
@@ -141,8 +168,19 @@ class OutputSummarizer:
 
         return self._truncate_to_words(summary, self.config.max_spoken_length)
 
-    def _smart_summary(self, text: str, has_error: bool, has_question: bool, is_complete: bool) -> str:
+    def _smart_summary(
+        self,
+        text: str,
+        lines: list[str],
+        has_error: bool,
+        has_question: bool,
+        is_complete: bool,
+    ) -> str:
         """Create an intelligent summary extracting key information."""
+        # Nothing worth extracting from a short reply; read it instead
+        if len(text) < self.SHORT_TEXT_CHARS and not (has_error or has_question):
+            return self._truncate_to_words(" ".join(text.split()), self.config.max_spoken_length)
+
         parts = []
 
         # Start with status
@@ -155,7 +193,7 @@ class OutputSummarizer:
         elif has_question:
             parts.append("Question from Claude:")
             # Extract the question
-            question = self._extract_question(text)
+            question = self._extract_question(lines)
             if question:
                 parts.append(question)
         elif is_complete:
@@ -183,66 +221,42 @@ class OutputSummarizer:
 
         # If nothing extracted, fall back to first_last
         if len(parts) <= 1:
-            return self._first_last_summary(text)
+            return self._first_last_summary(lines)
 
         summary = " ".join(parts)
         return self._truncate_to_words(summary, self.config.max_spoken_length)
 
     def _extract_error_message(self, text: str) -> str | None:
         """Extract the main error message."""
-        for pattern in self.ERROR_PATTERNS:
-            match = re.search(f"{pattern}.*", text, re.IGNORECASE)
-            if match:
-                # Get the line containing the error
-                line = match.group(0)
-                # Clean and truncate
-                line = re.sub(r"\s+", " ", line).strip()
-                if len(line) > 100:
-                    line = line[:100] + "..."
-                return line
+        match = self._ERROR_LINE_RE.search(text)
+        if match:
+            # Get the line containing the error
+            line = match.group(0)
+            # Clean and truncate
+            line = re.sub(r"\s+", " ", line).strip()
+            if len(line) > 100:
+                line = line[:100] + "..."
+            return line
         return None
 
-    def _extract_question(self, text: str) -> str | None:
+    def _extract_question(self, lines: list[str]) -> str | None:
         """Extract a question from the output."""
-        lines = text.strip().split("\n")
         # Look for lines ending in ? or containing question patterns
         for line in reversed(lines[-10:]):  # Check last 10 lines
             line = line.strip()
-            if line.endswith("?") or any(re.search(p, line, re.IGNORECASE) for p in self.QUESTION_PATTERNS):
+            if line.endswith("?") or self._QUESTION_RE.search(line):
                 return line[:150] if len(line) > 150 else line
         return None
 
     def _extract_actions(self, text: str) -> list[str]:
         """Extract action statements from output."""
-        action_patterns = [
-            r"(Created .+?\.)",
-            r"(Updated .+?\.)",
-            r"(Added .+?\.)",
-            r"(Removed .+?\.)",
-            r"(Fixed .+?\.)",
-            r"(Installed .+?\.)",
-            r"(Running .+?\.)",
-            r"(Building .+?\.)",
-        ]
-
-        actions = []
-        for pattern in action_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            actions.extend(matches)
-
-        return actions
+        return self._ACTION_RE.findall(text)
 
     def _extract_files(self, text: str) -> list[str]:
         """Extract mentioned file names."""
-        files = re.findall(self.FILE_PATTERN, text)
-        # Deduplicate while preserving order
-        seen = set()
-        unique_files = []
-        for f in files:
-            if f not in seen and not f.startswith("."):
-                seen.add(f)
-                unique_files.append(f)
-        return unique_files
+        # dict.fromkeys deduplicates while preserving order
+        files = dict.fromkeys(self._FILE_RE.findall(text))
+        return [f for f in files if not f.startswith(".")]
 
     def _extract_counts(self, text: str) -> list[str]:
         """Extract count information."""
@@ -1,10 +1,14 @@
 """Voice input handling using Whisper for speech-to-text."""
 
+import ctypes
 import io
+import queue
+import sys
 import tempfile
 import threading
 import time
 import wave
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
@@ -15,6 +19,7 @@ from .config import VoiceConfig
 
 # Lazy imports for heavy dependencies
 whisper = None
+faster_whisper = None
 pyaudio = None
 
 
@@ -25,6 +30,13 @@ def _ensure_whisper():
         whisper = _whisper
 
 
+def _ensure_faster_whisper():
+    global faster_whisper
+    if faster_whisper is None:
+        import faster_whisper as _faster_whisper
+        faster_whisper = _faster_whisper
+
+
 def _ensure_pyaudio():
     global pyaudio
     if pyaudio is None:
@@ -32,6 +44,105 @@ def _ensure_pyaudio():
         pyaudio = _pyaudio
 
 
+_PCM16_SCALE = np.float32(1 / 32768.0)
+
+
+def _pcm16_to_float(pcm: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Scale int16 samples into a float32 array in [-1, 1] in one pass, without temporaries."""
+    return np.multiply(pcm, _PCM16_SCALE, out=out, casting="unsafe")
+
+
+# macOS virtual keycodes of trigger keys that are in the same place on every
+# layout; character keys are looked up in the current layout instead
+_MAC_FIXED_KEYCODES = {
+    "space": 49,
+    "f1": 122, "f2": 120, "f3": 99, "f4": 118, "f5": 96, "f6": 97,
+    "f7": 98, "f8": 100, "f9": 101, "f10": 109, "f11": 103, "f12": 111,
+}
+
+_CARBON = "/System/Library/Frameworks/Carbon.framework/Carbon"
+_CORE_FOUNDATION = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+_UC_KEY_ACTION_DOWN = 0
+_UC_KEY_TRANSLATE_NO_DEAD_KEYS = 1
+
+
+def _layout_keycode(char: str) -> int | None:
+    """Virtual keycode of the key that types char on the current keyboard layout.
+
+    Keycodes are physical positions, so "v" is a different keycode on AZERTY
+    or Dvorak than on a US keyboard. Returns None if it can't be determined.
+    """
+    try:
+        carbon = ctypes.CDLL(_CARBON)
+        cf = ctypes.CDLL(_CORE_FOUNDATION)
+    except OSError:
+        return None
+
+    carbon.TISCopyCurrentKeyboardLayoutInputSource.restype = ctypes.c_void_p
+    carbon.TISGetInputSourceProperty.restype = ctypes.c_void_p
+    carbon.TISGetInputSourceProperty.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    carbon.LMGetKbdType.restype = ctypes.c_uint8
+    carbon.UCKeyTranslate.restype = ctypes.c_int32
+    carbon.UCKeyTranslate.argtypes = [
+        ctypes.c_void_p, ctypes.c_uint16, ctypes.c_uint16, ctypes.c_uint32, ctypes.c_uint32,
+        ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32), ctypes.c_ulong,
+        ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_uint16),
+    ]
+    cf.CFDataGetBytePtr.restype = ctypes.c_void_p
+    cf.CFDataGetBytePtr.argtypes = [ctypes.c_void_p]
+    cf.CFRelease.argtypes = [ctypes.c_void_p]
+
+    source = carbon.TISCopyCurrentKeyboardLayoutInputSource()
+    if not source:
+        return None
+    try:
+        layout_key = ctypes.c_void_p.in_dll(carbon, "kTISPropertyUnicodeKeyLayoutData")
+        layout_data = carbon.TISGetInputSourceProperty(source, layout_key)
+        if not layout_data:
+            return None  # Input methods without a key layout
+        layout = cf.CFDataGetBytePtr(layout_data)
+        kbd_type = carbon.LMGetKbdType()
+
+        dead_key_state = ctypes.c_uint32(0)
+        length = ctypes.c_ulong(0)
+        chars = (ctypes.c_uint16 * 4)()
+        for keycode in range(128):
+            status = carbon.UCKeyTranslate(
+                layout, keycode, _UC_KEY_ACTION_DOWN, 0, kbd_type,
+                _UC_KEY_TRANSLATE_NO_DEAD_KEYS, ctypes.byref(dead_key_state),
+                len(chars), ctypes.byref(length), chars,
+            )
+            if status == 0 and length.value == 1 and chr(chars[0]).lower() == char:
+                return keycode
+    finally:
+        cf.CFRelease(source)
+    return None
+
+
+# Held modifiers are tracked as a bitmask
+_MOD_BITS = {"ctrl": 1, "shift": 2, "alt": 4, "cmd": 8}
+# Never set by a key, so hotkeys with an unknown modifier never fire
+_UNKNOWN_MOD_BIT = 16
+
+# pynput key names for each modifier side/alias, mapped to the modifier's bit
+_MOD_MAP = {
+    name: _MOD_BITS[modifier]
+    for modifier, names in {
+        "ctrl": ("ctrl", "ctrl_l", "ctrl_r"),
+        "shift": ("shift", "shift_l", "shift_r"),
+        "alt": ("alt", "alt_l", "alt_r", "option"),
+        "cmd": ("cmd", "cmd_l", "cmd_r", "super"),
+    }.items()
+    for name in names
+}
+
+
+def _key_name(key) -> str | None:
+    """Lower-cased character or name of a pynput key."""
+    name = getattr(key, "char", None) or getattr(key, "name", None)
+    return name.lower() if name else None
+
+
 @dataclass
 class TranscriptionResult:
     """Result of a voice transcription."""
@@ -50,25 +161,59 @@ class VoiceInputHandler:
     CHUNK_SIZE = 1024
     FORMAT_BITS = 16
 
+    # Longest recording kept; audio past this is dropped
+    MAX_RECORDING_SECONDS = 120
+
+    # Amplitude/RMS below which audio counts as silence, and how much
+    # audio to keep around the speech when trimming
+    SILENCE_THRESHOLD = 0.005
+    SILENCE_PADDING_SECONDS = 0.2
+
     def __init__(self, config: VoiceConfig):
         self.config = config
         self.model = None
+        self._fp16 = False
         self._recording = False
-        self._audio_data: list[bytes] = []
         self._stream = None
         self._audio = None
         self._lock = threading.Lock()
 
-    def load_model(self) -> None:
-        """Load the Whisper model."""
-        _ensure_whisper()
+        # The stream callback copies raw PCM into one preallocated buffer, reused
+        # across recordings, and queues the new end offset
+        self._pcm = bytearray()
+        self._pcm_len = 0
+
+        # Captured PCM is converted to float32 on a worker thread while
+        # recording continues, so the samples are ready when the key is released.
+        # SimpleQueue: put() never waits on a lock, so the audio callback can't stall
+        self._chunks: queue.SimpleQueue[int | None] = queue.SimpleQueue()
+        self._converter: threading.Thread | None = None
+        self._samples = np.empty(0, dtype=np.float32)
+        self._num_samples = 0
 
+    def load_model(self) -> None:
+        """Load the Whisper model for the configured backend."""
         model_name = self.config.whisper_model
         print(f"Loading Whisper model '{model_name}'...")
 
-        self.model = whisper.load_model(model_name)
+        if self._use_faster_whisper:
+            _ensure_faster_whisper()
+            # CTranslate2 with int8 weights: several times faster than PyTorch on CPU
+            self.model = faster_whisper.WhisperModel(
+                model_name, device="auto", compute_type="int8"
+            )
+        else:
+            _ensure_whisper()
+            self.model = whisper.load_model(model_name)
+            # Half precision only helps (and only works) on GPU
+            device = getattr(self.model, "device", None)
+            self._fp16 = getattr(device, "type", "cpu") == "cuda"
         print("Whisper model loaded.")
 
+    @property
+    def _use_faster_whisper(self) -> bool:
+        return self.config.whisper_backend == "faster-whisper"
+
     def ensure_model_loaded(self) -> None:
         """Ensure the model is loaded."""
         if self.model is None:
@@ -82,10 +227,24 @@ class VoiceInputHandler:
             if self._recording:
                 return
 
-            self._audio_data = []
+            max_samples = self.SAMPLE_RATE * self.MAX_RECORDING_SECONDS
+            if not self._pcm:
+                self._pcm = bytearray(max_samples * 2)
+            self._pcm_len = 0
+
+            # Fresh buffer per recording: the previous one may still be transcribing
+            self._samples = np.empty(max_samples, dtype=np.float32)
+            self._num_samples = 0
+            self._chunks = queue.SimpleQueue()
+            self._converter = threading.Thread(
+                target=self._convert_chunks, args=(self._chunks,), daemon=True
+            )
+            self._converter.start()
             self._recording = True
 
-            self._audio = pyaudio.PyAudio()
+            # PortAudio is initialized once and kept until shutdown()
+            if self._audio is None:
+                self._audio = pyaudio.PyAudio()
             self._stream = self._audio.open(
                 format=pyaudio.paInt16,
                 channels=self.CHANNELS,
@@ -101,11 +260,25 @@ class VoiceInputHandler:
         _ensure_pyaudio()
 
         if self._recording:
-            self._audio_data.append(in_data)
+            start = self._pcm_len
+            end = min(start + len(in_data), len(self._pcm))
+            if end > start:
+                self._pcm[start:end] = in_data[:end - start]
+                self._pcm_len = end
+                self._chunks.put(end)
         return (in_data, pyaudio.paContinue)
 
-    def stop_recording(self) -> bytes:
-        """Stop recording and return the audio data."""
+    def _convert_chunks(self, chunks: "queue.SimpleQueue[int | None]") -> None:
+        """Convert captured PCM up to each queued byte offset until a None sentinel."""
+        pcm = np.frombuffer(self._pcm, dtype=np.int16)
+        while (end := chunks.get()) is not None:
+            start = self._num_samples
+            stop = end // 2
+            _pcm16_to_float(pcm[start:stop], self._samples[start:stop])
+            self._num_samples = stop
+
+    def stop_recording(self) -> np.ndarray:
+        """Stop recording and return the audio as float32 samples in [-1, 1]."""
         _ensure_pyaudio()
 
         with self._lock:
@@ -116,41 +289,85 @@ class VoiceInputHandler:
                 self._stream.close()
                 self._stream = None
 
+            # Let the converter drain what was captured before the stream closed
+            if self._converter:
+                self._chunks.put(None)
+                self._converter.join()
+                self._converter = None
+
+            return self._samples[:self._num_samples]
+
+    def shutdown(self) -> None:
+        """Stop any recording and release the audio device."""
+        if self._recording:
+            self.stop_recording()
+
+        with self._lock:
             if self._audio:
                 self._audio.terminate()
                 self._audio = None
 
-            audio_bytes = b"".join(self._audio_data)
-            self._audio_data = []
-            return audio_bytes
+    def transcribe_audio(self, audio_data: np.ndarray | bytes) -> TranscriptionResult | None:
+        """Transcribe audio to text using Whisper.
 
-    def transcribe_audio(self, audio_data: bytes) -> TranscriptionResult | None:
-        """Transcribe audio data to text using Whisper."""
+        Args:
+            audio_data: float32 samples from stop_recording(), or raw 16-bit PCM bytes
+        """
         self.ensure_model_loaded()
 
-        if not audio_data:
+        if len(audio_data) == 0:
+            return None
+
+        if isinstance(audio_data, np.ndarray):
+            audio_np = audio_data
+        else:
+            # Convert bytes to numpy array
+            pcm = np.frombuffer(audio_data, dtype=np.int16, count=len(audio_data) // 2)
+            audio_np = _pcm16_to_float(pcm, np.empty(len(pcm), dtype=np.float32))
+
+        # Skip the model entirely for silent or accidental presses
+        audio_np = self._trim_silence(audio_np)
+        if audio_np is None:
             return None
 
-        # Convert bytes to numpy array
-        audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+        language = self.config.language if self.config.language != "auto" else None
 
         # Transcribe
-        result = self.model.transcribe(
-            audio_np,
-            language=self.config.language if self.config.language != "auto" else None,
-            fp16=False,  # Use fp32 for CPU compatibility
-        )
+        if self._use_faster_whisper:
+            segments, info = self.model.transcribe(audio_np, language=language)
+            # Segments are decoded lazily as the generator is consumed
+            text = "".join(segment.text for segment in segments).strip()
+            detected_language = info.language or "en"
+        else:
+            result = self.model.transcribe(audio_np, language=language, fp16=self._fp16)
+            text = result.get("text", "").strip()
+            detected_language = result.get("language", "en")
 
-        text = result.get("text", "").strip()
         if not text:
             return None
 
         return TranscriptionResult(
             text=text,
-            language=result.get("language", "en"),
+            language=detected_language,
             confidence=1.0,  # Whisper doesn't provide per-transcription confidence
         )
 
+    def _trim_silence(self, audio: np.ndarray) -> np.ndarray | None:
+        """Trim leading and trailing silence, or return None if there's no speech."""
+        loud = np.abs(audio) > self.SILENCE_THRESHOLD
+        if not loud.any():
+            return None
+
+        padding = int(self.SAMPLE_RATE * self.SILENCE_PADDING_SECONDS)
+        start = max(int(np.argmax(loud)) - padding, 0)
+        end = min(len(audio) - int(np.argmax(loud[::-1])) + padding, len(audio))
+        audio = audio[start:end]
+
+        rms = np.sqrt(np.dot(audio, audio) / len(audio))
+        if rms < self.SILENCE_THRESHOLD:
+            return None
+        return audio
+
     def record_and_transcribe(self, duration: float = None, stop_event: threading.Event = None) -> TranscriptionResult | None:
         """Record audio and transcribe it.
 
@@ -198,90 +415,144 @@ class PushToTalkHandler:
         self._running = False
         self._key_pressed = False
         self._listener = None
+        self._tap = None
+        self._tap_loop = None
+        self._transcriber: ThreadPoolExecutor | None = None
+
+        # Parsed once so key events only compare precomputed values
+        self._required_modifiers, self._trigger_key = self._parse_hotkey()
+        self._required_mask = 0
+        for modifier in self._required_modifiers:
+            self._required_mask |= _MOD_BITS.get(modifier, _UNKNOWN_MOD_BIT)
 
-    def _parse_hotkey(self) -> tuple[set, str]:
+    def _parse_hotkey(self) -> tuple[frozenset[str], str]:
         """Parse hotkey string into modifiers and key."""
         parts = self.hotkey.lower().split("+")
         key = parts[-1]
-        modifiers = set(parts[:-1])
+        modifiers = frozenset(parts[:-1])
         return modifiers, key
 
     def start(self) -> None:
         """Start listening for the hotkey."""
-        from pynput import keyboard
-
         self._running = True
-        required_modifiers, trigger_key = self._parse_hotkey()
+        # One worker keeps transcriptions in the order they were spoken
+        self._transcriber = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transcribe")
+
+        # On macOS a Quartz event tap checks keycode and modifier flags natively;
+        # pynput is the fallback when the tap is unavailable or not permitted, or
+        # the trigger key isn't on the current keyboard layout
+        if sys.platform == "darwin" and self._start_event_tap():
+            return
+        self._start_listener()
+
+    def _start_event_tap(self) -> bool:
+        """Listen for the hotkey with a CGEventTap. Returns False if one can't be used."""
+        required_modifiers = self._required_modifiers
+        # Resolved when listening starts; a later layout switch needs a restart
+        keycode = _MAC_FIXED_KEYCODES.get(self._trigger_key)
+        if keycode is None and len(self._trigger_key) == 1:
+            keycode = _layout_keycode(self._trigger_key)
+        if keycode is None:
+            return False
+
+        try:
+            import Quartz
+        except ImportError:
+            return False
+
+        modifier_flags = {
+            "ctrl": Quartz.kCGEventFlagMaskControl,
+            "shift": Quartz.kCGEventFlagMaskShift,
+            "alt": Quartz.kCGEventFlagMaskAlternate,
+            "cmd": Quartz.kCGEventFlagMaskCommand,
+        }
+        if not required_modifiers <= modifier_flags.keys():
+            return False
+        flags_mask = 0
+        for modifier in required_modifiers:
+            flags_mask |= modifier_flags[modifier]
+
+        key_down = Quartz.kCGEventKeyDown
+        keycode_field = Quartz.kCGKeyboardEventKeycode
+        disabled = (Quartz.kCGEventTapDisabledByTimeout, Quartz.kCGEventTapDisabledByUserInput)
+
+        def callback(proxy, event_type, event, refcon):
+            if event_type in disabled:
+                # The system disables slow taps; turn it back on
+                Quartz.CGEventTapEnable(tap, True)
+            elif Quartz.CGEventGetIntegerValueField(event, keycode_field) == keycode:
+                if event_type == key_down:
+                    if not self._key_pressed and Quartz.CGEventGetFlags(event) & flags_mask == flags_mask:
+                        self._key_pressed = True
+                        self._on_hotkey_pressed()
+                elif self._key_pressed:
+                    self._key_pressed = False
+                    self._on_hotkey_released()
+            return event
+
+        tap = Quartz.CGEventTapCreate(
+            Quartz.kCGSessionEventTap,
+            Quartz.kCGHeadInsertEventTap,
+            Quartz.kCGEventTapOptionListenOnly,
+            Quartz.CGEventMaskBit(key_down) | Quartz.CGEventMaskBit(Quartz.kCGEventKeyUp),
+            callback,
+            None,
+        )
+        if tap is None:
+            # Input Monitoring permission not granted
+            return False
+
+        ready = threading.Event()
+
+        def run_loop():
+            source = Quartz.CFMachPortCreateRunLoopSource(None, tap, 0)
+            self._tap_loop = Quartz.CFRunLoopGetCurrent()
+            Quartz.CFRunLoopAddSource(self._tap_loop, source, Quartz.kCFRunLoopCommonModes)
+            Quartz.CGEventTapEnable(tap, True)
+            ready.set()
+            Quartz.CFRunLoopRun()
+
+        self._tap = tap
+        threading.Thread(target=run_loop, name="hotkey-tap", daemon=True).start()
+        ready.wait()
+        return True
+
+    def _start_listener(self) -> None:
+        """Listen for the hotkey with pynput."""
+        from pynput import keyboard
 
-        current_modifiers = set()
+        trigger_key = self._trigger_key
+        required_mask = self._required_mask
+        held_mask = 0
 
         def on_press(key):
-            nonlocal current_modifiers
+            nonlocal held_mask
 
             if not self._running:
                 return False
 
-            # Track modifiers
-            try:
-                if hasattr(key, "name"):
-                    key_name = key.name.lower()
-                    if key_name in ("ctrl", "ctrl_l", "ctrl_r"):
-                        current_modifiers.add("ctrl")
-                    elif key_name in ("shift", "shift_l", "shift_r"):
-                        current_modifiers.add("shift")
-                    elif key_name in ("alt", "alt_l", "alt_r", "option"):
-                        current_modifiers.add("alt")
-                    elif key_name in ("cmd", "cmd_l", "cmd_r", "super"):
-                        current_modifiers.add("cmd")
-            except AttributeError:
-                pass
-
-            # Check for trigger key
-            try:
-                key_char = key.char.lower() if hasattr(key, "char") and key.char else None
-                key_name = key.name.lower() if hasattr(key, "name") else None
-                actual_key = key_char or key_name
-
-                if actual_key == trigger_key and required_modifiers <= current_modifiers:
-                    if not self._key_pressed:
-                        self._key_pressed = True
-                        self._on_hotkey_pressed()
-            except AttributeError:
-                pass
+            key_name = _key_name(key)
+            modifier = _MOD_MAP.get(key_name)
+            if modifier:
+                held_mask |= modifier
+            elif key_name == trigger_key and held_mask & required_mask == required_mask:
+                if not self._key_pressed:
+                    self._key_pressed = True
+                    self._on_hotkey_pressed()
 
         def on_release(key):
-            nonlocal current_modifiers
+            nonlocal held_mask
 
             if not self._running:
                 return False
 
-            # Track modifier release
-            try:
-                if hasattr(key, "name"):
-                    key_name = key.name.lower()
-                    if key_name in ("ctrl", "ctrl_l", "ctrl_r"):
-                        current_modifiers.discard("ctrl")
-                    elif key_name in ("shift", "shift_l", "shift_r"):
-                        current_modifiers.discard("shift")
-                    elif key_name in ("alt", "alt_l", "alt_r", "option"):
-                        current_modifiers.discard("alt")
-                    elif key_name in ("cmd", "cmd_l", "cmd_r", "super"):
-                        current_modifiers.discard("cmd")
-            except AttributeError:
-                pass
-
-            # Check for trigger key release
-            try:
-                key_char = key.char.lower() if hasattr(key, "char") and key.char else None
-                key_name = key.name.lower() if hasattr(key, "name") else None
-                actual_key = key_char or key_name
-
-                if actual_key == trigger_key:
-                    if self._key_pressed:
-                        self._key_pressed = False
-                        self._on_hotkey_released()
-            except AttributeError:
-                pass
+            key_name = _key_name(key)
+            modifier = _MOD_MAP.get(key_name)
+            if modifier:
+                held_mask &= ~modifier
+            elif key_name == trigger_key and self._key_pressed:
+                self._key_pressed = False
+                self._on_hotkey_released()
 
         self._listener = keyboard.Listener(on_press=on_press, on_release=on_release)
         self._listener.start()
@@ -298,17 +569,36 @@ class PushToTalkHandler:
             self.on_stop()
 
         audio_data = self.voice_input.stop_recording()
-        result = self.voice_input.transcribe_audio(audio_data)
-
-        if result and result.text:
-            self.on_transcription(result.text)
+        # Transcribe off the keyboard listener thread so key events keep flowing
+        if self._transcriber:
+            self._transcriber.submit(self._transcribe, audio_data)
+
+    def _transcribe(self, audio_data: np.ndarray) -> None:
+        """Transcribe a recording and hand the text to the callback."""
+        try:
+            result = self.voice_input.transcribe_audio(audio_data)
+            if result and result.text:
+                self.on_transcription(result.text)
+        except Exception as e:
+            print(f"Transcription failed: {e}")
 
     def stop(self) -> None:
         """Stop listening for the hotkey."""
         self._running = False
+        if self._tap is not None:
+            import Quartz
+
+            Quartz.CGEventTapEnable(self._tap, False)
+            Quartz.CFRunLoopStop(self._tap_loop)
+            self._tap = None
+            self._tap_loop = None
         if self._listener:
             self._listener.stop()
             self._listener = None
+        if self._transcriber:
+            self._transcriber.shutdown(wait=False, cancel_futures=True)
+            self._transcriber = None
+        self.voice_input.shutdown()
 
     def is_running(self) -> bool:
         """Check if the handler is running."""
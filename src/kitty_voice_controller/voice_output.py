@@ -1,21 +1,266 @@
 """Voice output handling using macOS text-to-speech."""
 
+import ctypes
+import functools
+import itertools
+import os
+import queue
+import re
+import shutil
+import signal
 import subprocess
+import sys
+import tempfile
 import threading
+import time
+import wave
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 
 from .config import VoiceConfig
 
 
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+# A period after these doesn't end the sentence
+_ABBREVIATIONS = frozenset(
+    {"dr.", "mr.", "mrs.", "ms.", "st.", "vs.", "etc.", "e.g.", "i.e.", "am.", "pm.", "a.m.", "p.m."}
+)
+# Shorter fragments are spoken together with the next sentence
+_MIN_SENTENCE_CHARS = 10
+# Most sentences grouped into one chunk of speech
+_MAX_SENTENCES_PER_CHUNK = 8
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Split text into sentences so speech can start before the whole text is synthesized."""
+    sentences = []
+    current = ""
+    for piece in _SENTENCE_END_RE.split(text.strip()):
+        current = f"{current} {piece}" if current else piece
+        if len(current) < _MIN_SENTENCE_CHARS:
+            continue
+        if current.rsplit(None, 1)[-1].lower() in _ABBREVIATIONS:
+            continue
+        sentences.append(current)
+        current = ""
+    if current:
+        sentences.append(current)
+    return sentences
+
+
+# A line of `say -v ?`: "Name    language  # sample text" (names can contain spaces)
+_VOICE_LINE_RE = re.compile(r"^(\S.*?)\s+(\S+)\s+#", re.MULTILINE)
+
+
+def _progressive_chunks(sentences: list[str]) -> list[str]:
+    """Group sentences into chunks of 1, 2, 4, ... up to _MAX_SENTENCES_PER_CHUNK.
+
+    The first sentence goes alone so speech starts as soon as possible;
+    later ones are batched to cut the per-chunk overhead of long replies.
+    """
+    chunks = []
+    start, size = 0, 1
+    while start < len(sentences):
+        chunks.append(" ".join(sentences[start:start + size]))
+        start += size
+        size = min(size * 2, _MAX_SENTENCES_PER_CHUNK)
+    return chunks
+
+
+# Child stdout/stderr go to /dev/null
+_DEVNULL_OUTPUT = [
+    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+]
+
+
+class _Process:
+    """A 'say' or 'afplay' child started with posix_spawn.
+
+    subprocess forks on macOS, copying the page tables of a process that may
+    hold a loaded Whisper model; posix_spawn starts the child without that.
+    The thread that calls wait() reaps it.
+    """
+
+    def __init__(self, argv: list[str]):
+        self.pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=_DEVNULL_OUTPUT)
+        self.returncode: int | None = None
+
+    def wait(self) -> int:
+        if self.returncode is None:
+            _, status = os.waitpid(self.pid, 0)
+            self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def terminate(self) -> None:
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+
+def _run(argv: list[str]) -> int:
+    """Run a command to completion with its output discarded; return its exit code."""
+    return _Process(argv).wait()
+
+
+def _close_output_stream(audio, stream) -> None:
+    stream.close()
+    audio.terminate()
+
+
+class _SpeechSynthesizer:
+    """Long-lived AVSpeechSynthesizer: voices stay loaded and nothing is spawned per utterance."""
+
+    # `say` rate (words per minute) that corresponds to AVSpeechUtteranceDefaultSpeechRate
+    DEFAULT_WPM = 175
+    # Completion is read from isSpeaking() (delegate callbacks need a main run
+    # loop, which the asyncio thread doesn't run); it may lag speakUtterance_
+    # briefly, so speech counts as started for this long regardless
+    START_CHECK_SECONDS = 0.1
+    POLL_SECONDS = 0.05
+
+    def __init__(self, config: VoiceConfig, avfoundation):
+        self.config = config
+        self._av = avfoundation
+        self._synth = avfoundation.AVSpeechSynthesizer.alloc().init()
+        self._voice = next(
+            (
+                voice
+                for voice in avfoundation.AVSpeechSynthesisVoice.speechVoices()
+                if voice.name() == config.tts_voice
+            ),
+            None,
+        )
+        self._finished = threading.Event()
+        self._finished.set()
+        self._started = 0.0
+
+    @classmethod
+    def create(cls, config: VoiceConfig) -> "_SpeechSynthesizer | None":
+        """Create a synthesizer, or None if AVFoundation isn't available."""
+        if sys.platform != "darwin":
+            return None
+        try:
+            import AVFoundation
+        except ImportError:
+            return None
+        return cls(config, AVFoundation)
+
+    def _rate(self) -> float:
+        av = self._av
+        rate = av.AVSpeechUtteranceDefaultSpeechRate * self.config.tts_rate / self.DEFAULT_WPM
+        return min(
+            max(rate, av.AVSpeechUtteranceMinimumSpeechRate), av.AVSpeechUtteranceMaximumSpeechRate
+        )
+
+    def speak(self, sentences: list[str]) -> threading.Event:
+        """Replace any current speech with sentences spoken in order.
+
+        Returns immediately with an event that is set once they're done; the
+        new event is in place before the old speech stops, so is_speaking()
+        doesn't read False in between.
+        """
+        # Read per call: rate and volume can change while running
+        rate = self._rate()
+        volume = self.config.volume
+
+        previous = self._finished
+        self._finished = finished = threading.Event()
+        self._started = time.monotonic()
+        if not previous.is_set():
+            self._synth.stopSpeakingAtBoundary_(self._av.AVSpeechBoundaryImmediate)
+            previous.set()
+
+        for sentence in sentences:
+            utterance = self._av.AVSpeechUtterance.speechUtteranceWithString_(sentence)
+            if self._voice is not None:
+                utterance.setVoice_(self._voice)
+            utterance.setRate_(rate)
+            utterance.setVolume_(volume)
+            self._synth.speakUtterance_(utterance)
+        return finished
+
+    def _check_done(self, finished: threading.Event) -> bool:
+        """Set finished once the synthesizer has gone quiet; return whether it's set."""
+        if (
+            not finished.is_set()
+            and time.monotonic() - self._started > self.START_CHECK_SECONDS
+            and not self._synth.isSpeaking()
+        ):
+            finished.set()
+        return finished.is_set()
+
+    def wait(self, finished: threading.Event) -> None:
+        """Block until the speech speak() returned finished for is done, stopped or replaced."""
+        while not self._check_done(finished):
+            finished.wait(self.POLL_SECONDS)
+
+    def stop(self) -> None:
+        """Stop speaking immediately and drop queued speech."""
+        self._synth.stopSpeakingAtBoundary_(self._av.AVSpeechBoundaryImmediate)
+        self._finished.set()
+
+    def is_speaking(self) -> bool:
+        return not self._check_done(self._finished)
+
+
 class VoiceOutputHandler:
-    """Handles voice output using macOS 'say' command."""
+    """Handles voice output using macOS speech synthesis.
+
+    Speaks through AVSpeechSynthesizer when PyObjC's AVFoundation bindings
+    are installed, and through the 'say' command otherwise.
+    """
+
+    # Sentences rendered ahead of the one playing when using 'say'
+    SYNTH_LOOKAHEAD = 3
+    # Audio file paths kept for reuse: enough for a cancelled utterance's
+    # renders to finish while the next one starts
+    AUDIO_PATH_POOL = 2 * (SYNTH_LOOKAHEAD + 1)
+    # Format 'say' renders in, and that the output stream is opened for
+    SAMPLE_RATE = 22050
+    # Frames written to the output stream at a time; stop() takes effect between writes
+    STREAM_BLOCK_FRAMES = 1024
 
     def __init__(self, config: VoiceConfig):
         self.config = config
-        self._speaking = False
-        self._current_process: subprocess.Popen | None = None
+        # Event rather than bool + lock so is_speaking() never blocks
+        self._speaking = threading.Event()
+        self._current_process: _Process | None = None
+        # Set to cancel the sentences of the current speak() call
+        self._cancel = threading.Event()
+        # Bumped by stop() so queued speak_async() calls are dropped
+        self._generation = 0
         self._lock = threading.Lock()
+        self._synth = _SpeechSynthesizer.create(config)
+        # Renders upcoming sentences to audio files in parallel with playback
+        self._synth_pool = ThreadPoolExecutor(
+            max_workers=self.SYNTH_LOOKAHEAD, thread_name_prefix="say"
+        )
+
+        # Fixed set of render targets, reused instead of creating and deleting files
+        self._audio_paths: deque[Path] = deque()
+        if not self._synth:
+            self._audio_dir = Path(tempfile.mkdtemp(prefix="kvc_tts_"))
+            weakref.finalize(self, shutil.rmtree, self._audio_dir, ignore_errors=True)
+            self._audio_path_ids = itertools.count()
+            self._audio_paths.extend(self._new_audio_path() for _ in range(self.AUDIO_PATH_POOL))
+
+        # Rendered speech is played through one output stream kept open across
+        # utterances, instead of an afplay process (and device open) per chunk
+        self._stream = None if self._synth else self._open_output_stream()
+        # Stops a cancelled utterance's last block interleaving with the next one's
+        self._stream_lock = threading.Lock()
+
+        # speak_async() calls run in order on one long-lived worker thread
+        self._speak_queue: queue.SimpleQueue[tuple[str, Callable[[], None] | None, int]] = (
+            queue.SimpleQueue()
+        )
+        threading.Thread(target=self._speak_worker, name="speak", daemon=True).start()
 
     def speak(self, text: str, blocking: bool = True) -> None:
         """Speak the given text.
@@ -24,52 +269,205 @@ class VoiceOutputHandler:
             text: Text to speak
             blocking: If True, wait for speech to complete
         """
+        self._speak(text, blocking)
+
+    def _speak(self, text: str, blocking: bool, generation: int | None = None) -> None:
         if not text:
             return
 
+        # Spoken in chunks so the first sentence plays without waiting for the rest
+        chunks = _progressive_chunks(_split_sentences(text))
+
         with self._lock:
-            # Stop any current speech
-            self.stop()
-
-            cmd = [
-                "say",
-                "-v", self.config.tts_voice,
-                "-r", str(self.config.tts_rate),
-                text,
-            ]
+            if generation is not None and generation != self._generation:
+                return  # Interrupted before it started
+
+            # Replace any current speech: the new state is in place before the
+            # old playback is killed, so is_speaking() never reads False in between
+            old_cancel, old_process = self._cancel, self._current_process
+            cancel = self._cancel = threading.Event()
+            self._current_process = None
+            if self._synth:
+                finished = self._synth.speak(chunks)
+            else:
+                self._speaking.set()
+                if not blocking:
+                    threading.Thread(
+                        target=self._say_sentences, args=(chunks, cancel), daemon=True
+                    ).start()
+            old_cancel.set()
+            if old_process:
+                old_process.terminate()
 
-            if blocking:
-                subprocess.run(cmd, check=False)
+        # Wait outside the lock so stop() can interrupt
+        if blocking:
+            if self._synth:
+                self._synth.wait(finished)
             else:
-                self._current_process = subprocess.Popen(cmd)
-                self._speaking = True
+                self._say_sentences(chunks, cancel)
+
+    def _say_sentences(self, sentences: list[str], cancel: threading.Event) -> None:
+        """Speak sentences until done or cancelled.
+
+        Up to SYNTH_LOOKAHEAD sentences are rendered with 'say -o' in parallel
+        while earlier ones play in order, through the output stream or else one
+        'afplay' at a time.
+        """
+        upcoming = iter(sentences)
+        pending = deque()
+
+        def submit_next() -> None:
+            for sentence in upcoming:
+                path = self._take_audio_path()
+                pending.append((path, self._synth_pool.submit(self._synthesize, sentence, path)))
+                return
+
+        try:
+            for _ in range(self.SYNTH_LOOKAHEAD):
+                submit_next()
+
+            while pending:
+                if cancel.is_set():
+                    return
+                path, future = pending.popleft()
+                try:
+                    submit_next()
+                    if not future.result():
+                        continue
+                    if self._stream is not None and self._stream_file(path, cancel):
+                        continue
+                    with self._lock:
+                        if cancel.is_set():
+                            return
+                        process = self._current_process = _Process(["afplay", str(path)])
+                    process.wait()
+                finally:
+                    self._audio_paths.append(path)
+        finally:
+            for _, future in pending:
+                future.cancel()
+            with self._lock:
+                if self._cancel is cancel:
+                    self._current_process = None
+                    self._speaking.clear()
+            # A path can only be reused once nothing is still rendering into it
+            for path, future in pending:
+                if not future.cancelled():
+                    future.exception()
+                self._audio_paths.append(path)
+
+    def _open_output_stream(self):
+        """Open a PyAudio output stream for rendered speech, or None if PyAudio isn't usable."""
+        try:
+            import pyaudio
+
+            audio = pyaudio.PyAudio()
+        except Exception:
+            return None
+        try:
+            stream = audio.open(
+                format=pyaudio.paInt16,
+                channels=1,
+                rate=self.SAMPLE_RATE,
+                output=True,
+                frames_per_buffer=self.STREAM_BLOCK_FRAMES,
+            )
+        except Exception:
+            audio.terminate()
+            return None
+        weakref.finalize(self, _close_output_stream, audio, stream)
+        return stream
+
+    def _stream_file(self, path: Path, cancel: threading.Event) -> bool:
+        """Write a rendered WAVE file to the output stream until it ends or is cancelled.
+
+        Returns False, having played nothing, if the file can't be parsed or
+        isn't in the stream's format, so the caller can fall back to afplay.
+        """
+        try:
+            wav = wave.open(str(path), "rb")
+        except (EOFError, wave.Error):
+            return False
+        with wav:
+            if (wav.getnchannels(), wav.getsampwidth(), wav.getframerate()) != (
+                1, 2, self.SAMPLE_RATE
+            ):
+                return False
+            while not cancel.is_set():
+                frames = wav.readframes(self.STREAM_BLOCK_FRAMES)
+                if not frames:
+                    break
+                with self._stream_lock:
+                    self._stream.write(frames)
+        return True
+
+    def _new_audio_path(self) -> Path:
+        return self._audio_dir / f"speech{next(self._audio_path_ids)}.wav"
+
+    def _take_audio_path(self) -> Path:
+        try:
+            return self._audio_paths.popleft()
+        except IndexError:
+            # All in use (e.g. several overlapping utterances); grow the pool
+            return self._new_audio_path()
+
+    def _synthesize(self, sentence: str, path: Path) -> bool:
+        """Render a sentence to a 16-bit 22.05 kHz WAVE file with 'say'."""
+        returncode = _run([
+            "say",
+            "-v", self.config.tts_voice,
+            "-r", str(self.config.tts_rate),
+            "-o", str(path),
+            "--data-format=LEI16@22050",
+            sentence,
+        ])
+        return returncode == 0
 
     def speak_async(self, text: str, on_complete: Callable[[], None] | None = None) -> None:
-        """Speak text asynchronously."""
-        def _speak_thread():
-            self.speak(text, blocking=True)
-            self._speaking = False
-            if on_complete:
-                on_complete()
+        """Speak text asynchronously, after any earlier speak_async() calls."""
+        self._speak_queue.put((text, on_complete, self._generation))
 
-        thread = threading.Thread(target=_speak_thread, daemon=True)
-        thread.start()
+    def _speak_worker(self) -> None:
+        while True:
+            text, on_complete, generation = self._speak_queue.get()
+            try:
+                self._speak(text, blocking=True, generation=generation)
+                if on_complete:
+                    on_complete()
+            except Exception:
+                continue  # Keep serving later calls
 
     def stop(self) -> None:
-        """Stop current speech."""
+        """Stop current speech and drop queued speak_async() calls."""
         with self._lock:
+            # Calls queued before now are skipped when the worker reaches them
+            self._generation += 1
+            self._cancel.set()
+            if self._synth:
+                self._synth.stop()
             if self._current_process:
                 self._current_process.terminate()
                 self._current_process = None
-            self._speaking = False
+            self._speaking.clear()
+
+    def interrupt(self) -> None:
+        """Cut speech off now, including speak_async() calls that haven't started (barge-in)."""
+        self.stop()
 
     def is_speaking(self) -> bool:
         """Check if currently speaking."""
-        return self._speaking
+        if self._synth:
+            return self._synth.is_speaking()
+        return self._speaking.is_set()
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def list_voices() -> list[dict]:
-        """List available macOS voices."""
+        """List available macOS voices.
+
+        The result is cached for the life of the process; installed voices
+        don't change during a session.
+        """
         try:
             result = subprocess.run(
                 ["say", "-v", "?"],
@@ -78,22 +476,135 @@ class VoiceOutputHandler:
                 check=True,
             )
 
-            voices = []
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-                # Parse format: "Name    language  # description"
-                parts = line.split()
-                if len(parts) >= 2:
-                    name = parts[0]
-                    lang = parts[1] if len(parts) > 1 else ""
-                    voices.append({"name": name, "language": lang})
-
-            return voices
+            return [
+                {"name": name, "language": language}
+                for name, language in _VOICE_LINE_RE.findall(result.stdout)
+            ]
         except Exception:
             return []
 
 
+class _SystemSounds:
+    """Short sounds registered once with AudioToolbox and played without a process."""
+
+    AUDIO_TOOLBOX = "/System/Library/Frameworks/AudioToolbox.framework/AudioToolbox"
+    CORE_FOUNDATION = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+
+    def __init__(self):
+        self._toolbox = ctypes.CDLL(self.AUDIO_TOOLBOX)
+        self._cf = ctypes.CDLL(self.CORE_FOUNDATION)
+
+        self._cf.CFURLCreateFromFileSystemRepresentation.restype = ctypes.c_void_p
+        self._cf.CFURLCreateFromFileSystemRepresentation.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long, ctypes.c_bool,
+        ]
+        self._cf.CFRelease.argtypes = [ctypes.c_void_p]
+        self._toolbox.AudioServicesCreateSystemSoundID.restype = ctypes.c_int32
+        self._toolbox.AudioServicesCreateSystemSoundID.argtypes = [
+            ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32),
+        ]
+        self._toolbox.AudioServicesDisposeSystemSoundID.argtypes = [ctypes.c_uint32]
+        self._toolbox.AudioServicesPlaySystemSound.argtypes = [ctypes.c_uint32]
+
+    @classmethod
+    def create(cls) -> "_SystemSounds | None":
+        """Load AudioToolbox, or return None if it isn't available."""
+        if sys.platform != "darwin":
+            return None
+        try:
+            return cls()
+        except (OSError, AttributeError):
+            return None
+
+    def load(self, path: str | Path) -> int | None:
+        """Register a sound file, returning its SystemSoundID."""
+        encoded = os.fsencode(path)
+        url = self._cf.CFURLCreateFromFileSystemRepresentation(None, encoded, len(encoded), False)
+        if not url:
+            return None
+        try:
+            sound_id = ctypes.c_uint32()
+            status = self._toolbox.AudioServicesCreateSystemSoundID(url, ctypes.byref(sound_id))
+        finally:
+            self._cf.CFRelease(url)
+        return sound_id.value if status == 0 else None
+
+    def dispose(self, sound_id: int) -> None:
+        self._toolbox.AudioServicesDisposeSystemSoundID(sound_id)
+
+    def play(self, sound_id: int) -> None:
+        """Start playing a registered sound; returns immediately."""
+        self._toolbox.AudioServicesPlaySystemSound(sound_id)
+
+
+class _EngineSounds:
+    """Sounds pre-decoded to PCM buffers and scheduled on a running AVAudioEngine.
+
+    Nothing is decoded or allocated per play, and the engine keeps the
+    output device open, so there's no hardware spin-up either.
+    """
+
+    def __init__(self, avfoundation, foundation):
+        self._av = avfoundation
+        self._foundation = foundation
+        self._engine = avfoundation.AVAudioEngine.alloc().init()
+
+    @classmethod
+    def create(cls) -> "_EngineSounds | None":
+        """Create an engine, or return None if AVFoundation isn't available."""
+        if sys.platform != "darwin":
+            return None
+        try:
+            import AVFoundation
+            import Foundation
+        except ImportError:
+            return None
+        return cls(AVFoundation, Foundation)
+
+    def load(self, path: str | Path) -> Any:
+        """Decode a sound file into a buffer with its own player node."""
+        av = self._av
+        url = self._foundation.NSURL.fileURLWithPath_(str(path))
+        audio_file, _ = av.AVAudioFile.alloc().initForReading_error_(url, None)
+        if audio_file is None:
+            return None
+        buffer = av.AVAudioPCMBuffer.alloc().initWithPCMFormat_frameCapacity_(
+            audio_file.processingFormat(), audio_file.length()
+        )
+        ok, _ = audio_file.readIntoBuffer_error_(buffer, None)
+        if not ok:
+            return None
+
+        player = av.AVAudioPlayerNode.alloc().init()
+        self._engine.attachNode_(player)
+        self._engine.connect_to_format_(player, self._engine.mainMixerNode(), buffer.format())
+        # The engine can only start once something is connected to it
+        if not self._engine.isRunning():
+            started, _ = self._engine.startAndReturnError_(None)
+            if not started:
+                self._engine.detachNode_(player)
+                return None
+        return player, buffer
+
+    def dispose(self, handle: Any) -> None:
+        player, _ = handle
+        player.stop()
+        self._engine.detachNode_(player)
+
+    def play(self, handle: Any) -> None:
+        """Schedule a loaded sound from the start; returns immediately."""
+        player, buffer = handle
+        player.scheduleBuffer_atTime_options_completionHandler_(
+            buffer, None, self._av.AVAudioPlayerNodeBufferInterrupts, None
+        )
+        if not player.isPlaying():
+            player.play()
+
+
+# Runs (and reaps) afplay for non-blocking sounds; also caps how many play at once
+_sound_exec = ThreadPoolExecutor(max_workers=2, thread_name_prefix="snd")
+
+
 class SoundPlayer:
     """Plays feedback sounds."""
 
@@ -109,32 +620,68 @@ class SoundPlayer:
         self.config = config
         self._custom_sounds: dict[str, Path] = {}
 
+        # Resolved once so play() is just lookups; sounds without a
+        # sound_<name> setting (e.g. success) are always on
+        self._enabled: dict[str, bool] = {
+            name: getattr(config, f"sound_{name}", True) for name in self.SOUNDS
+        }
+        self._argv: dict[str, list[str]] = {
+            name: ["afplay", str(path)] for name, path in self.SOUNDS.items()
+        }
+
+        # Sounds are decoded once up front so non-blocking plays don't spawn
+        # afplay: into AVAudioEngine buffers with PyObjC, else as system sounds
+        self._native = _EngineSounds.create() or _SystemSounds.create()
+        self._native_sounds: dict[str, Any] = {}
+        for name in self.SOUNDS:
+            self._load_sound(name)
+
+        # Last afplay queued per sound, to drop repeats that haven't started yet
+        self._queued: dict[str, Future] = {}
+
+    def _load_sound(self, name: str) -> None:
+        """(Re)load a sound for native playback, if available."""
+        if not self._native:
+            return
+        old = self._native_sounds.pop(name, None)
+        if old is not None:
+            self._native.dispose(old)
+
+        sound_path = self._custom_sounds.get(name) or self.SOUNDS.get(name)
+        if sound_path:
+            loaded = self._native.load(sound_path)
+            if loaded is not None:
+                self._native_sounds[name] = loaded
+
     def set_custom_sound(self, name: str, path: Path) -> None:
         """Set a custom sound file for a sound type."""
         self._custom_sounds[name] = path
+        self._argv[name] = ["afplay", str(path)]
+        self._load_sound(name)
 
     def play(self, sound_name: str, blocking: bool = False) -> None:
         """Play a sound by name."""
-        # Check config for whether this sound is enabled
-        if sound_name == "listen_start" and not self.config.sound_listen_start:
-            return
-        if sound_name == "listen_stop" and not self.config.sound_listen_stop:
-            return
-        if sound_name == "error" and not self.config.sound_error:
+        if not self._enabled.get(sound_name, True):
             return
 
-        # Get sound path
-        sound_path = self._custom_sounds.get(sound_name) or self.SOUNDS.get(sound_name)
-        if not sound_path:
+        native_sound = self._native_sounds.get(sound_name)
+        if native_sound is not None and not blocking:
+            self._native.play(native_sound)
             return
 
         # Play using afplay
-        cmd = ["afplay", str(sound_path)]
+        cmd = self._argv.get(sound_name)
+        if not cmd:
+            return
 
         if blocking:
-            subprocess.run(cmd, check=False)
-        else:
-            subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            _run(cmd)
+            return
+
+        queued = self._queued.get(sound_name)
+        if queued is not None and not queued.running() and not queued.done():
+            return  # The same sound is still waiting to play
+        self._queued[sound_name] = _sound_exec.submit(_run, cmd)
 
     def play_listen_start(self) -> None:
         """Play the listening start sound."""